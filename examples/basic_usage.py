@@ -13,9 +13,24 @@ Or with inline script dependencies:
     # ///
 """
 
+import os
+
+import polars as pl
+
 from pipolars import PIClient, PIConfig, SummaryType
 from pipolars.core.config import CacheBackend, CacheConfig, PIServerConfig
 
+# Set PIPOLARS_QUIET=1 to skip printing frames (e.g. when timing the examples)
+QUIET = bool(os.environ.get("PIPOLARS_QUIET"))
+
+
+def show(df: pl.DataFrame, n: int = 5, label: str | None = None) -> None:
+    """Print the first ``n`` rows of a DataFrame, or only its shape if QUIET."""
+    if label:
+        print(f"{label}:")
+    print(df.shape if QUIET else df.head(n))
+    print()
+
 
 def example_basic_connection() -> None:
     """Example: Basic connection and snapshot."""
@@ -27,7 +42,7 @@ def example_basic_connection() -> None:
     with PIClient("my-pi-server") as client:
         # Get current value
         df = client.snapshot("SINUSOID")
-        print(f"Current value:\n{df}\n")
+        show(df, label="Current value")
 
 
 def example_recorded_values() -> None:
@@ -44,8 +59,7 @@ def example_recorded_values() -> None:
             end="*",
         )
         print(f"Recorded values (last 24h): {len(df)} rows")
-        print(df.head())
-        print()
+        show(df)
 
         # Get data for multiple tags
         df_multi = client.recorded_values(
@@ -54,8 +68,7 @@ def example_recorded_values() -> None:
             end="*",
         )
         print(f"Multi-tag data: {len(df_multi)} rows")
-        print(df_multi.head())
-        print()
+        show(df_multi)
 
 
 def example_interpolated_values() -> None:
@@ -73,8 +86,7 @@ def example_interpolated_values() -> None:
             interval="1h",
         )
         print(f"Hourly values: {len(df)} rows")
-        print(df.head())
-        print()
+        show(df)
 
         # Get 15-minute intervals for multiple tags, pivoted
         df_pivot = client.interpolated_values(
@@ -84,7 +96,7 @@ def example_interpolated_values() -> None:
             interval="15m",
             pivot=True,  # Tags become columns
         )
-        print(f"Pivoted data:\n{df_pivot.head()}\n")
+        show(df_pivot, label="Pivoted data")
 
 
 def example_summaries() -> None:
@@ -106,7 +118,7 @@ def example_summaries() -> None:
                 SummaryType.STD_DEV,
             ],
         )
-        print(f"Weekly summary:\n{df}\n")
+        show(df, label="Weekly summary")
 
         # Get hourly summaries
         df_hourly = client.summaries(
@@ -117,8 +129,7 @@ def example_summaries() -> None:
             summary_types=SummaryType.AVERAGE,
         )
         print(f"Hourly averages: {len(df_hourly)} rows")
-        print(df_hourly.head())
-        print()
+        show(df_hourly)
 
 
 def example_query_builder() -> None:
@@ -137,8 +148,7 @@ def example_query_builder() -> None:
             .to_dataframe()
         )
         print(f"Query result: {len(df)} rows")
-        print(df.head())
-        print()
+        show(df)
 
         # Multi-tag query with pivot
         df_pivot = (
@@ -148,7 +158,7 @@ def example_query_builder() -> None:
             .pivot()
             .to_dataframe()
         )
-        print(f"Pivoted query:\n{df_pivot.head()}\n")
+        show(df_pivot, label="Pivoted query")
 
 
 def example_convenience_methods() -> None:
@@ -232,8 +242,7 @@ def example_data_processing() -> None:
         )
 
         print(f"Processed data: {len(result)} rows")
-        print(result.head(10))
-        print()
+        show(result, n=10)
 
 
 def main() -> None:
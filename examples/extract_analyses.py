@@ -8,18 +8,21 @@ This script extracts:
 Uses Windows authentication to connect to the servers.
 """
 
+import functools
+import io
+import itertools
 import json
+import re
 import sys
-import io
+import threading
 import traceback
-from datetime import datetime, timezone
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-# Fix encoding for Windows console
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
-
 # Add pipolars to path
 sys.path.insert(0, str(Path(__file__).parent / "pipolars" / "src"))
 
@@ -27,14 +30,145 @@ from pipolars.connection.af_database import AFDatabaseConnection
 from pipolars.connection.sdk import get_sdk_manager
 from pipolars.core.config import AFServerConfig
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Fix encoding for Windows console
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
+
 # Global verbose flag for detailed logging
 VERBOSE_LOGGING = True
 
-
-def log_verbose(message: str) -> None:
-    """Print message if verbose logging is enabled."""
-    if VERBOSE_LOGGING:
-        print(message)
+# AF SDK types resolved on first use, keyed by short type name
+_CLR_TYPES: dict[str, Any] = {}
+
+# AFStatus.Enabled
+_AF_STATUS_ENABLED = 0
+
+# Last target element path and its (path, plant name, plant category), see _element_meta
+_LAST_ELEMENT: tuple[str | None, tuple[str | None, str | None, int | None]] | None = None
+
+# .NET DateTime.Ticks are 100 ns intervals since 0001-01-01 00:00:00
+_NET_EPOCH = datetime(1, 1, 1)
+_TICKS_PER_MILLISECOND = 10_000
+
+# Plant category by path keyword, in order of precedence
+_PLANT_CATEGORIES = {
+    "hydro": 1,  # Hydro
+    "thermal": 2,  # Thermal
+    "coal": 2,
+    "solar": 3,  # Solar
+    "ges": 3,
+    "wind": 4,  # Wind
+    "res": 4,
+    "gas": 5,  # Gas
+}
+# Lookahead so overlapping keywords (e.g. "gasolar") are all reported
+_PLANT_KEYWORD_RE = re.compile(f"(?=({'|'.join(_PLANT_CATEGORIES)}))")
+
+# Upper bound on databases extracted concurrently
+MAX_DATABASE_WORKERS = 8
+
+# Output file buffer; records are appended as bytes and flushed in large writes
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Attributes probed with hasattr() on AFAnalysis and its AnalysisRule. Members
+# every AFAnalysis has (Name, ID, Description, Version, IsCheckedOut,
+# CreationDate, CreatedBy, ModifyDate, ModifiedBy) are read directly.
+_PROBED_ANALYSIS_ATTRS: tuple[str, ...] = (
+    "AnalysisRulePlugIn",
+    "Target",
+    "Template",
+    "AnalysisRule",
+    "Status",
+    "TimeRule",
+    "Severity",
+    "CheckedOutBy",
+    "CheckedInDate",
+    "IsDirty",
+)
+_PROBED_RULE_ATTRS: tuple[str, ...] = (
+    "ConfigString",
+    "Expression",
+    "TrueFor",
+    "TrueForEnding",
+    "EndExpression",
+    "Severity",
+    "PlugIn",
+    "GetConfiguration",
+    "VariableMapping",
+    "Outputs",
+    "RollupType",
+    "RollupSource",
+)
+
+# Per-type attribute schema caches (see _probe_schema)
+_ANALYSIS_SCHEMA_CACHE: dict[type, dict[str, bool]] = {}
+_RULE_SCHEMA_CACHE: dict[type, dict[str, bool]] = {}
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+# Event frame template name inside an AnalysisRule ConfigString
+_EFTNAME_RE = re.compile(r"EFTNAME=([^;]*)")
+
+# First public member names per AnalysisRule type, for verbose logging only
+_AR_DIR_CACHE: dict[type, list[str]] = {}
+
+
+@dataclass(slots=True)
+class AnalysisRecord:
+    """Extracted properties of one AF Analysis, in output field order."""
+
+    Name: str | None = None
+    Id: str | None = None
+    Description: str | None = None
+    DatabaseName: str | None = None
+    AnalysisRulePlugInName: str | None = None
+    AnalysisType: str | None = None
+    ElementPath: str | None = None
+    PlantName: str | None = None
+    PlantCategory: int | None = None
+    TemplateName: str | None = None
+    EventFrameTemplateName: str | None = None
+    ConfigExpression: str | None = None
+    IsEnabled: bool | None = None
+    ScheduleType: str | None = None
+    StartTrigger: str | None = None
+    EndTrigger: str | None = None
+    TrueFor: str | None = None
+    TrueForEnding: str | None = None
+    Severity: str | None = None
+    InputCount: int = 0
+    OutputCount: int = 0
+    RollupType: str | None = None
+    RollupSource: str | None = None
+    RollupInputAttribute: str | None = None
+    RollupOutputAttribute: str | None = None
+    Version: int = 0
+    IsCheckedOut: bool = False
+    CheckedOutBy: str | None = None
+    CheckedInDate: datetime | None = None
+    IsDirty: bool = False
+    CreateDate: datetime | None = None
+    CreatedBy: str | None = None
+    ModifyDate: datetime | None = None
+    ModifiedBy: str | None = None
+    ExtractedAt: str | None = None
+
+
+def _print_verbose(message: str, *args: Any) -> None:
+    """Print a %-style message, formatting it only when it is emitted."""
+    print(message % args if args else message)
+
+
+def _skip_verbose(message: str, *args: Any) -> None:
+    """Discard a verbose message without formatting it."""
+
+
+# Bound once at import time so disabled verbose logging costs a bare call
+log_verbose = _print_verbose if VERBOSE_LOGGING else _skip_verbose
 
 
 def serialize_datetime(obj: Any) -> Any:
@@ -44,50 +178,173 @@ def serialize_datetime(obj: Any) -> Any:
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def dump_record(record: AnalysisRecord) -> bytes:
+    """Encode one record as a UTF-8 JSON line (NDJSON)."""
+    if orjson is not None:
+        # orjson serializes (slotted) dataclasses natively
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(asdict(record), default=serialize_datetime, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
 def convert_net_datetime(net_datetime: Any) -> datetime | None:
     """Convert a .NET DateTime to Python datetime."""
     try:
-        return datetime(
-            net_datetime.Year,
-            net_datetime.Month,
-            net_datetime.Day,
-            net_datetime.Hour,
-            net_datetime.Minute,
-            net_datetime.Second,
-            net_datetime.Millisecond * 1000,
-        )
+        # One Ticks read instead of seven field reads; truncated to milliseconds
+        return _NET_EPOCH + timedelta(milliseconds=net_datetime.Ticks // _TICKS_PER_MILLISECOND)
     except Exception:
         return None
 
 
 def safe_str(value: Any) -> str | None:
-    """Safely convert a value to string."""
-    if value is None:
-        return None
+    """Convert a value to string, passing None through.
+
+    ``str()`` on a CLR object does not raise in practice; any failure is
+    left to the caller's per-analysis error handling.
+    """
+    return None if value is None else str(value)
+
+
+def _probe_schema(obj: Any, names: tuple[str, ...], cache: dict[type, dict[str, bool]]) -> dict[str, bool]:
+    """
+    Return which of ``names`` exist on ``obj``, probing once per .NET type.
+
+    ``hasattr`` on a pythonnet proxy goes through .NET reflection, so the
+    result is cached by ``type(obj)`` and reused for every later object of
+    the same type.
+    """
+    obj_type = type(obj)
+    schema = cache.get(obj_type)
+    if schema is None:
+        schema = {name: hasattr(obj, name) for name in names}
+        with _SCHEMA_CACHE_LOCK:
+            schema = cache.setdefault(obj_type, schema)
+    return schema
+
+
+def _element_meta(element: Any) -> tuple[str | None, str | None, int | None]:
+    """
+    Return ``(path, plant name, plant category)`` for a target element.
+
+    Analyses on the same element are visited one after another, so only
+    the last element is remembered, keyed by its path (pythonnet hands out
+    a new proxy on every ``Target`` read). The slot is replaced as a single
+    tuple, which keeps it consistent when databases are extracted
+    concurrently.
+    """
+    global _LAST_ELEMENT
+    path = safe_str(element.GetPath())
+    last = _LAST_ELEMENT
+    if last is not None and last[0] == path:
+        return last[1]
+    element_path = path or ""
+    meta = (path, extract_plant_name(element_path), determine_plant_category(element_path))
+    _LAST_ELEMENT = (path, meta)
+    return meta
+
+
+def _count_items(collection: Any) -> int:
+    """Count a .NET collection via ``Count`` without copying it into a list."""
+    if collection is None:
+        return 0
+    count = getattr(collection, "Count", None)
+    if count is not None:
+        return int(count)
+    return sum(1 for _ in collection)
+
+
+def _rule_attr_names(ar: Any, limit: int = 15) -> list[str]:
+    """Return the first ``limit`` public member names of ``ar``, cached per type."""
+    ar_type = type(ar)
+    names = _AR_DIR_CACHE.get(ar_type)
+    if names is None:
+        public = (attr for attr in dir(ar) if not attr.startswith("_"))
+        names = _AR_DIR_CACHE.setdefault(ar_type, list(itertools.islice(public, limit)))
+    return names
+
+
+def _get_clr_type(sdk: Any, namespace: str, type_name: str) -> Any:
+    """Resolve an AF SDK type once and reuse it for later lookups."""
+    clr_type = _CLR_TYPES.get(type_name)
+    if clr_type is None:
+        clr_type = _CLR_TYPES.setdefault(type_name, sdk.get_type(namespace, type_name))
+    return clr_type
+
+
+def _preload_analyses(sdk: Any, analyses_collection: Any) -> None:
+    """
+    Load a whole analyses collection into the client cache in one server call.
+
+    Without this every property read on a not-yet-loaded AFAnalysis is its
+    own round trip. The bulk loader is looked up at runtime because it is not
+    available in every AF SDK version; when it is missing or fails, analyses
+    are simply loaded lazily as before.
+    """
     try:
-        return str(value)
-    except Exception:
-        return None
+        AFAnalysis = _get_clr_type(sdk, "OSIsoft.AF.Analysis", "AFAnalysis")
+        load_analyses = getattr(AFAnalysis, "LoadAnalyses", None)
+        if load_analyses is not None and analyses_collection.Count > 0:
+            load_analyses(analyses_collection)
+    except Exception as e:
+        log_verbose("  Bulk analysis load skipped: %s", e)
+
 
+def _extract_database_analyses(db: Any, sdk: Any, extraction_time: str) -> list[AnalysisRecord]:
+    """
+    Extract all analyses from a single AF database.
 
-def extract_analyses_from_all_databases(af_server: str) -> list[dict[str, Any]]:
+    Args:
+        db: AFDatabase object
+        sdk: SDK manager instance
+        extraction_time: ISO timestamp of extraction
+
+    Returns:
+        List of analysis records for this database.
+    """
+    db_name = str(db.Name)
+    print(f"\n--- Processing database: {db_name} ---")
+
+    db_analyses: list[AnalysisRecord] = []
+    try:
+        # Get analyses from this database
+        analyses_collection = db.Analyses
+        count = analyses_collection.Count
+        print(f"  Found {count} analyses in database {db_name}")
+        _preload_analyses(sdk, analyses_collection)
+
+        for analysis in analyses_collection:
+            try:
+                analysis_info = extract_analysis_info_raw(analysis, extraction_time, db_name)
+                db_analyses.append(analysis_info)
+            except Exception as e:
+                print(f"    Error extracting analysis: {e}")
+
+    except Exception as e:
+        print(f"  Error accessing database {db_name}: {e}")
+
+    return db_analyses
+
+
+def extract_analyses_from_all_databases(af_server: str, out_path: Path) -> int:
     """
     Extract all AF Analyses from ALL databases on the PI AF Server.
 
+    Analyses are written to ``out_path`` as NDJSON, one database at a time,
+    so only a single database's records are held in memory.
+
     Args:
         af_server: AF Server name (e.g., "GENCOPI")
+        out_path: Output file for the NDJSON records
 
     Returns:
-        List of analysis dictionaries with all attributes and properties.
+        Number of analyses written.
     """
     sdk = get_sdk_manager()
     sdk.initialize()
 
-    all_analyses = []
     extraction_time = datetime.now(timezone.utc).isoformat()
 
     # Get PISystems collection to enumerate databases
-    PISystems = sdk.get_type("OSIsoft.AF", "PISystems")
+    PISystems = _get_clr_type(sdk, "OSIsoft.AF", "PISystems")
     systems = PISystems()
     pi_system = systems[af_server]
 
@@ -102,28 +359,27 @@ def extract_analyses_from_all_databases(af_server: str) -> list[dict[str, Any]]:
         databases = pi_system.Databases
         print(f"Found {databases.Count} databases")
 
-        for db in databases:
-            db_name = str(db.Name)
-            print(f"\n--- Processing database: {db_name} ---")
-
-            try:
-                # Get analyses from this database
-                analyses_collection = db.Analyses
-                count = analyses_collection.Count
-                print(f"  Found {count} analyses in database {db_name}")
-
-                for analysis in analyses_collection:
-                    try:
-                        analysis_info = extract_analysis_info_raw(analysis, sdk, extraction_time, db_name)
-                        all_analyses.append(analysis_info)
-                    except Exception as e:
-                        print(f"    Error extracting analysis: {e}")
-
-            except Exception as e:
-                print(f"  Error accessing database {db_name}: {e}")
-
-        print(f"\nTotal analyses extracted: {len(all_analyses)}")
-        return all_analyses
+        # Databases are independent, so extract them concurrently; AF SDK calls
+        # release the GIL while waiting on the server
+        database_list = list(databases)
+        max_workers = max(1, min(MAX_DATABASE_WORKERS, len(database_list)))
+        total = 0
+        with (
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+            out_path.open("wb", buffering=OUTPUT_BUFFER_SIZE) as f,
+        ):
+            futures = [
+                executor.submit(_extract_database_analyses, db, sdk, extraction_time)
+                for db in database_list
+            ]
+            # Keep results in database order regardless of completion order
+            for future in futures:
+                db_analyses = future.result()
+                f.writelines(dump_record(info) for info in db_analyses)
+                total += len(db_analyses)
+
+        print(f"\nTotal analyses extracted: {total}")
+        return total
 
     finally:
         # Always disconnect from the server
@@ -134,28 +390,35 @@ def extract_analyses_from_all_databases(af_server: str) -> list[dict[str, Any]]:
             print(f"Warning: Error disconnecting from AF Server: {e}")
 
 
-def extract_analyses(af_server: str, database: str | None = None) -> list[dict[str, Any]]:
+def extract_analyses(af_server: str, out_path: Path, database: str | None = None) -> int:
     """
     Extract all AF Analyses from the PI AF Server with comprehensive attributes.
 
+    Each analysis is written to ``out_path`` as one NDJSON line as soon as
+    it has been extracted.
+
     Args:
         af_server: AF Server name (e.g., "GENCOPI")
+        out_path: Output file for the NDJSON records
         database: Optional database name. If None, extracts from ALL databases.
 
     Returns:
-        List of analysis dictionaries with all attributes and properties.
+        Number of analyses written.
     """
     # If no specific database is specified, extract from all databases
     if database is None:
-        return extract_analyses_from_all_databases(af_server)
+        return extract_analyses_from_all_databases(af_server, out_path)
 
     config = AFServerConfig(host=af_server, database=database)
     sdk = get_sdk_manager()
 
-    analyses_list = []
+    total = 0
     extraction_time = datetime.now(timezone.utc).isoformat()
 
-    with AFDatabaseConnection(config) as conn:
+    with (
+        AFDatabaseConnection(config) as conn,
+        out_path.open("wb", buffering=OUTPUT_BUFFER_SIZE) as f,
+    ):
         print(f"Connected to AF Server: {conn.pi_system.Name}")
         print(f"Database: {conn.database.Name}")
 
@@ -169,12 +432,14 @@ def extract_analyses(af_server: str, database: str | None = None) -> list[dict[s
         try:
             analyses_collection = af_database.Analyses
             print(f"Found {analyses_collection.Count} analyses in database")
+            _preload_analyses(sdk, analyses_collection)
 
             for analysis in analyses_collection:
                 try:
                     analysis_info = extract_analysis_info(analysis, sdk, extraction_time, conn)
-                    analyses_list.append(analysis_info)
-                    print(f"  Extracted analysis: {analysis_info['Name']}")
+                    f.write(dump_record(analysis_info))
+                    total += 1
+                    print(f"  Extracted analysis: {analysis_info.Name}")
                 except Exception as e:
                     print(f"  Error extracting analysis: {e}")
                     traceback.print_exc()
@@ -182,562 +447,262 @@ def extract_analyses(af_server: str, database: str | None = None) -> list[dict[s
         except AttributeError:
             # If Analyses collection not directly available, search for them
             print("Searching for analyses through elements...")
-            analyses_list = search_analyses_in_elements(conn, sdk, extraction_time)
-
-    return analyses_list
-
-
-def extract_analysis_info_raw(analysis: Any, sdk: Any, extraction_time: str, database_name: str) -> dict[str, Any]:
+            for analysis_info in search_analyses_in_elements(conn, sdk, extraction_time):
+                f.write(dump_record(analysis_info))
+                total += 1
+
+    return total
+
+
+def _extract_expression_rule_fields(ar: Any, rule_schema: dict[str, bool], info: AnalysisRecord) -> None:
+    """Fill StartTrigger from the rule expression; the rest is in ConfigString."""
+    if rule_schema["Expression"]:
+        info.StartTrigger = safe_str(ar.Expression)
+
+
+def _extract_event_frame_rule_fields(ar: Any, rule_schema: dict[str, bool], info: AnalysisRecord) -> None:
+    """Fill StartTrigger / EndTrigger / TrueFor / Severity of an event frame rule."""
+    _extract_expression_rule_fields(ar, rule_schema, info)
+
+    # For EventFrame type analyses, the AnalysisRule might be AFEventFrameGenerationRule
+    # Try accessing properties directly on the rule
+    if rule_schema["TrueFor"]:
+        true_for_raw = ar.TrueFor
+        log_verbose("      -> TrueFor raw: %s, type: %s", true_for_raw, type(true_for_raw))
+        if true_for_raw:
+            # TrueFor is typically a TimeSpan
+            total_seconds = getattr(true_for_raw, "TotalSeconds", None)
+            if total_seconds is not None:
+                log_verbose("      -> TrueFor TotalSeconds: %s", total_seconds)
+                if total_seconds > 0:
+                    info.TrueFor = safe_str(true_for_raw)
+            else:
+                info.TrueFor = safe_str(true_for_raw)
+    else:
+        log_verbose("      -> TrueFor attribute not found on AnalysisRule")
+
+    true_for_ending = ar.TrueForEnding if rule_schema["TrueForEnding"] else None
+    if true_for_ending:
+        total_seconds = getattr(true_for_ending, "TotalSeconds", None)
+        if total_seconds is not None:
+            if total_seconds > 0:
+                info.TrueForEnding = safe_str(true_for_ending)
+        else:
+            info.TrueForEnding = safe_str(true_for_ending)
+
+    # Try to get EndTrigger
+    if rule_schema["EndExpression"]:
+        info.EndTrigger = safe_str(ar.EndExpression)
+
+    # Try to get Severity from the rule
+    if rule_schema["Severity"]:
+        severity_raw = ar.Severity
+        log_verbose("      -> Severity raw: %s, type: %s", severity_raw, type(severity_raw))
+        if severity_raw:
+            info.Severity = safe_str(severity_raw)
+    else:
+        log_verbose("      -> Severity attribute not found on AnalysisRule")
+
+    # Also try to get from nested PlugIn config if available
+    plugin = ar.PlugIn if rule_schema["PlugIn"] else None
+    if plugin:
+        plugin_name = safe_str(getattr(plugin, "Name", None))
+        log_verbose("      -> PlugIn: %s", plugin_name)
+        if plugin_name and "EventFrame" in plugin_name and rule_schema["GetConfiguration"]:
+            # This is an event frame generation rule; GetConfiguration() can
+            # throw for rules that are not fully configured
+            try:
+                config = ar.GetConfiguration()
+                log_verbose("      -> Got configuration: %s", type(config))
+                if config and hasattr(config, "TrueFor"):
+                    info.TrueFor = safe_str(config.TrueFor)
+                    log_verbose("      -> TrueFor from config: %s", info.TrueFor)
+                if config and hasattr(config, "Severity"):
+                    info.Severity = safe_str(config.Severity)
+                    log_verbose("      -> Severity from config: %s", info.Severity)
+            except Exception as cfg_e:
+                log_verbose("      -> Error getting config: %s", cfg_e)
+
+
+def _extract_rollup_rule_fields(ar: Any, rule_schema: dict[str, bool], info: AnalysisRecord) -> None:
+    """Fill the rollup fields (RollupInput/OutputAttribute are not exposed by the rule)."""
+    _extract_expression_rule_fields(ar, rule_schema, info)
+    if rule_schema["RollupType"]:
+        info.RollupType = safe_str(ar.RollupType)
+    if rule_schema["RollupSource"]:
+        info.RollupSource = safe_str(ar.RollupSource)
+
+
+def _extract_generic_rule_fields(ar: Any, rule_schema: dict[str, bool], info: AnalysisRecord) -> None:
+    """Probe every rule-specific field for plugin kinds without a dedicated extractor."""
+    _extract_event_frame_rule_fields(ar, rule_schema, info)
+    _extract_rollup_rule_fields(ar, rule_schema, info)
+
+
+# Rule field extractors keyed by lower-cased AnalysisRulePlugIn name; other
+# plug-ins (e.g. SQC) use _extract_generic_rule_fields
+_RULE_FIELD_EXTRACTORS: dict[str, Callable[[Any, dict[str, bool], AnalysisRecord], None]] = {
+    "eventframe": _extract_event_frame_rule_fields,
+    "performanceequation": _extract_expression_rule_fields,
+    "rollup": _extract_rollup_rule_fields,
+}
+
+
+def _extract_analysis_info_impl(analysis: Any, extraction_time: str, database_name: str) -> AnalysisRecord:
     """
-    Extract comprehensive information from an AF Analysis object (raw SDK access).
+    Extract comprehensive information from an AF Analysis object.
+
+    Shared implementation behind ``extract_analysis_info_raw`` and
+    ``extract_analysis_info``. Attribute presence is known from the cached
+    type schema, so fields are read without per-field exception handlers;
+    an SDK error aborts the whole analysis and is handled by the caller.
 
     Args:
         analysis: AFAnalysis object
-        sdk: SDK manager instance
         extraction_time: ISO timestamp of extraction
         database_name: Name of the database
 
     Returns:
-        Dictionary with all analysis attributes and properties in the specified format.
+        AnalysisRecord with all analysis attributes and properties.
     """
-    info: dict[str, Any] = {}
+    schema = _probe_schema(analysis, _PROBED_ANALYSIS_ATTRS, _ANALYSIS_SCHEMA_CACHE)
 
     # Basic identification
-    info["Name"] = safe_str(analysis.Name)
-    info["Id"] = safe_str(analysis.ID) if hasattr(analysis, "ID") else None
-    info["Description"] = safe_str(analysis.Description) if analysis.Description else None
-    info["DatabaseName"] = database_name
+    info = AnalysisRecord(
+        Name=safe_str(analysis.Name),
+        DatabaseName=database_name,
+        ExtractedAt=extraction_time,
+    )
+    info.Id = safe_str(analysis.ID)
+    description = analysis.Description
+    info.Description = safe_str(description) if description else None
 
-    log_verbose(f"    [Extracting] {info['Name']}")
+    log_verbose("    [Extracting] %s", info.Name)
 
     # Analysis Rule Plugin Name
-    try:
-        if hasattr(analysis, "AnalysisRulePlugIn") and analysis.AnalysisRulePlugIn:
-            info["AnalysisRulePlugInName"] = safe_str(analysis.AnalysisRulePlugIn.Name)
-            log_verbose(f"      -> AnalysisType: {info['AnalysisRulePlugInName']}")
-        else:
-            info["AnalysisRulePlugInName"] = None
-    except Exception:
-        info["AnalysisRulePlugInName"] = None
+    rule_plugin = analysis.AnalysisRulePlugIn if schema["AnalysisRulePlugIn"] else None
+    info.AnalysisRulePlugInName = safe_str(rule_plugin.Name) if rule_plugin else None
+    log_verbose("      -> AnalysisType: %s", info.AnalysisRulePlugInName)
 
     # Analysis Type (derived from plugin name)
-    info["AnalysisType"] = info.get("AnalysisRulePlugInName")
+    info.AnalysisType = info.AnalysisRulePlugInName
 
     # Element Path (Target element)
-    try:
-        if hasattr(analysis, "Target") and analysis.Target:
-            info["ElementPath"] = safe_str(analysis.Target.GetPath())
-        else:
-            info["ElementPath"] = None
-    except Exception:
-        info["ElementPath"] = None
-
-    # Get Plant Name and Category from element path
-    element_path = info.get("ElementPath") or ""
-    info["PlantName"] = extract_plant_name(element_path)
-    info["PlantCategory"] = determine_plant_category(element_path)
+    target = analysis.Target if schema["Target"] else None
+    # Plant Name and Category are derived from the element path
+    if target:
+        info.ElementPath, info.PlantName, info.PlantCategory = _element_meta(target)
 
     # Template Name
-    try:
-        if hasattr(analysis, "Template") and analysis.Template:
-            info["TemplateName"] = safe_str(analysis.Template.Name)
-        else:
-            info["TemplateName"] = None
-    except Exception:
-        info["TemplateName"] = None
+    template = analysis.Template if schema["Template"] else None
+    info.TemplateName = safe_str(template.Name) if template else None
 
-    # Event Frame Template Name (if applicable)
-    info["EventFrameTemplateName"] = None
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            ar = analysis.AnalysisRule
-            if hasattr(ar, "ConfigString"):
-                config_str = safe_str(ar.ConfigString)
-                if config_str and "EFTNAME=" in config_str:
-                    parts = config_str.split("EFTNAME=")
-                    if len(parts) > 1:
-                        eft_name = parts[1].split(";")[0]
-                        info["EventFrameTemplateName"] = eft_name
-    except Exception:
-        pass
+    # Analysis Rule (shared by the rule-derived fields below)
+    ar = analysis.AnalysisRule if schema["AnalysisRule"] else None
+    rule_schema = _probe_schema(ar, _PROBED_RULE_ATTRS, _RULE_SCHEMA_CACHE) if ar else {}
 
-    # Config Expression
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            info["ConfigExpression"] = safe_str(analysis.AnalysisRule.ConfigString) if hasattr(analysis.AnalysisRule, "ConfigString") else None
-        else:
-            info["ConfigExpression"] = None
-    except Exception:
-        info["ConfigExpression"] = None
+    # Event Frame Template Name (if applicable) and Config Expression
+    if ar and rule_schema["ConfigString"]:
+        config_str = safe_str(ar.ConfigString)
+        info.ConfigExpression = config_str
+        match = _EFTNAME_RE.search(config_str) if config_str else None
+        if match:
+            info.EventFrameTemplateName = match.group(1)
 
     # Status and Enabled - AFAnalysis uses Status property with AFStatus enum
-    try:
-        if hasattr(analysis, "Status"):
-            status = analysis.Status
+    if schema["Status"]:
+        status = analysis.Status
+        if status is not None:
             # AFStatus enum: Enabled = 0, Disabled = 1
-            status_str = safe_str(status)
-            info["IsEnabled"] = status_str == "Enabled" if status_str else None
-            log_verbose(f"      -> Status: {status_str}, IsEnabled: {info['IsEnabled']}")
-        else:
-            info["IsEnabled"] = None
-            log_verbose(f"      -> Status property not found")
-    except Exception as e:
-        info["IsEnabled"] = None
-        log_verbose(f"      -> Error getting Status: {e}")
+            try:
+                info.IsEnabled = int(status) == _AF_STATUS_ENABLED
+            except (TypeError, ValueError):
+                info.IsEnabled = str(status) == "Enabled"
+        log_verbose("      -> Status: %s, IsEnabled: %s", status, info.IsEnabled)
+    else:
+        log_verbose("      -> Status property not found")
 
     # Schedule Type / Time Rule
-    try:
-        if hasattr(analysis, "TimeRule") and analysis.TimeRule:
-            tr = analysis.TimeRule
-            if hasattr(tr, "TimeRulePlugIn") and tr.TimeRulePlugIn:
-                info["ScheduleType"] = safe_str(tr.TimeRulePlugIn.Name)
-            else:
-                info["ScheduleType"] = safe_str(tr.Name) if hasattr(tr, "Name") else None
-            log_verbose(f"      -> ScheduleType: {info['ScheduleType']}")
-        else:
-            info["ScheduleType"] = None
-    except Exception:
-        info["ScheduleType"] = None
-
-    # Start Trigger / End Trigger / TrueFor / Severity (for event frame analyses)
-    info["StartTrigger"] = None
-    info["EndTrigger"] = None
-    info["TrueFor"] = None
-    info["TrueForEnding"] = None
-    info["Severity"] = None
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            ar = analysis.AnalysisRule
-            log_verbose(f"      -> AnalysisRule type: {type(ar).__name__}")
-
-            # List available attributes on the rule for debugging
-            ar_attrs = [attr for attr in dir(ar) if not attr.startswith('_')]
-            log_verbose(f"      -> AnalysisRule attrs (first 15): {ar_attrs[:15]}")
-
-            # Try to get Expression (StartTrigger)
-            if hasattr(ar, "Expression"):
-                info["StartTrigger"] = safe_str(ar.Expression)
-
-            # For EventFrame type analyses, the AnalysisRule might be AFEventFrameGenerationRule
-            # Try accessing properties directly on the rule
-            if hasattr(ar, "TrueFor"):
-                true_for_raw = ar.TrueFor
-                log_verbose(f"      -> TrueFor raw: {true_for_raw}, type: {type(true_for_raw)}")
-                if true_for_raw:
-                    # TrueFor is typically a TimeSpan
-                    if hasattr(true_for_raw, "TotalSeconds"):
-                        total_seconds = true_for_raw.TotalSeconds
-                        log_verbose(f"      -> TrueFor TotalSeconds: {total_seconds}")
-                        if total_seconds > 0:
-                            info["TrueFor"] = safe_str(true_for_raw)
-                    else:
-                        info["TrueFor"] = safe_str(true_for_raw)
-            else:
-                log_verbose(f"      -> TrueFor attribute not found on AnalysisRule")
-
-            if hasattr(ar, "TrueForEnding") and ar.TrueForEnding:
-                true_for_ending = ar.TrueForEnding
-                if hasattr(true_for_ending, "TotalSeconds"):
-                    total_seconds = true_for_ending.TotalSeconds
-                    if total_seconds > 0:
-                        info["TrueForEnding"] = safe_str(true_for_ending)
-                else:
-                    info["TrueForEnding"] = safe_str(true_for_ending)
-
-            # Try to get EndTrigger
-            if hasattr(ar, "EndExpression"):
-                info["EndTrigger"] = safe_str(ar.EndExpression)
-
-            # Try to get Severity from the rule
-            if hasattr(ar, "Severity"):
-                severity_raw = ar.Severity
-                log_verbose(f"      -> Severity raw: {severity_raw}, type: {type(severity_raw)}")
-                if severity_raw:
-                    info["Severity"] = safe_str(severity_raw)
-            else:
-                log_verbose(f"      -> Severity attribute not found on AnalysisRule")
-
-            # Also try to get from nested PlugIn config if available
-            if hasattr(ar, "PlugIn") and ar.PlugIn:
-                plugin = ar.PlugIn
-                plugin_name = safe_str(plugin.Name) if hasattr(plugin, "Name") else None
-                log_verbose(f"      -> PlugIn: {plugin_name}")
-                if plugin_name and "EventFrame" in plugin_name:
-                    # This is an event frame generation rule
-                    if hasattr(ar, "GetConfiguration"):
-                        try:
-                            config = ar.GetConfiguration()
-                            log_verbose(f"      -> Got configuration: {type(config)}")
-                            if config and hasattr(config, "TrueFor"):
-                                info["TrueFor"] = safe_str(config.TrueFor)
-                                log_verbose(f"      -> TrueFor from config: {info['TrueFor']}")
-                            if config and hasattr(config, "Severity"):
-                                info["Severity"] = safe_str(config.Severity)
-                                log_verbose(f"      -> Severity from config: {info['Severity']}")
-                        except Exception as cfg_e:
-                            log_verbose(f"      -> Error getting config: {cfg_e}")
+    tr = analysis.TimeRule if schema["TimeRule"] else None
+    if tr:
+        tr_plugin = getattr(tr, "TimeRulePlugIn", None)
+        if tr_plugin:
+            info.ScheduleType = safe_str(tr_plugin.Name)
         else:
-            log_verbose(f"      -> No AnalysisRule found")
-    except Exception as e:
-        log_verbose(f"      -> Error extracting rule properties: {e}")
+            info.ScheduleType = safe_str(getattr(tr, "Name", None))
+        log_verbose("      -> ScheduleType: %s", info.ScheduleType)
 
-    log_verbose(f"      -> Final: IsEnabled={info['IsEnabled']}, TrueFor={info['TrueFor']}, Severity={info['Severity']}")
+    if ar:
+        log_verbose("      -> AnalysisRule type: %s", type(ar).__name__)
 
-    # Input/Output counts
-    info["InputCount"] = 0
-    info["OutputCount"] = 0
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            ar = analysis.AnalysisRule
-            if hasattr(ar, "VariableMapping"):
-                info["InputCount"] = len(list(ar.VariableMapping)) if ar.VariableMapping else 0
-            if hasattr(ar, "Outputs"):
-                info["OutputCount"] = len(list(ar.Outputs)) if ar.Outputs else 0
-    except Exception:
-        pass
+        # List available attributes on the rule for debugging
+        if VERBOSE_LOGGING:
+            log_verbose("      -> AnalysisRule attrs (first 15): %s", _rule_attr_names(ar))
+
+        # Rule-specific fields, only probing what this plugin kind can have
+        rule_kind = (info.AnalysisRulePlugInName or "").lower()
+        _RULE_FIELD_EXTRACTORS.get(rule_kind, _extract_generic_rule_fields)(ar, rule_schema, info)
 
-    # Rollup information
-    info["RollupType"] = None
-    info["RollupSource"] = None
-    info["RollupInputAttribute"] = None
-    info["RollupOutputAttribute"] = None
+        # Input/Output counts
+        if rule_schema["VariableMapping"]:
+            info.InputCount = _count_items(ar.VariableMapping)
+        if rule_schema["Outputs"]:
+            info.OutputCount = _count_items(ar.Outputs)
+    else:
+        log_verbose("      -> No AnalysisRule found")
+
+    log_verbose("      -> Final: IsEnabled=%s, TrueFor=%s, Severity=%s", info.IsEnabled, info.TrueFor, info.Severity)
 
     # Severity (if not already set from AnalysisRule)
-    if info.get("Severity") is None:
-        try:
-            if hasattr(analysis, "Severity") and analysis.Severity:
-                info["Severity"] = safe_str(analysis.Severity)
-        except Exception:
-            pass
+    if info.Severity is None and schema["Severity"]:
+        severity = analysis.Severity
+        if severity:
+            info.Severity = safe_str(severity)
 
     # Version
-    try:
-        info["Version"] = int(analysis.Version) if hasattr(analysis, "Version") else 0
-    except Exception:
-        info["Version"] = 0
+    info.Version = int(analysis.Version)
 
     # Checkout information
-    info["IsCheckedOut"] = False
-    info["CheckedOutBy"] = None
-    info["CheckedInDate"] = None
-    try:
-        if hasattr(analysis, "IsCheckedOut"):
-            info["IsCheckedOut"] = bool(analysis.IsCheckedOut)
-        if hasattr(analysis, "CheckedOutBy"):
-            info["CheckedOutBy"] = safe_str(analysis.CheckedOutBy)
-        if hasattr(analysis, "CheckedInDate") and analysis.CheckedInDate:
-            info["CheckedInDate"] = convert_net_datetime(analysis.CheckedInDate.LocalTime)
-    except Exception:
-        pass
+    info.IsCheckedOut = bool(analysis.IsCheckedOut)
+    info.CheckedOutBy = safe_str(analysis.CheckedOutBy) if schema["CheckedOutBy"] else None
+    checked_in_date = analysis.CheckedInDate if schema["CheckedInDate"] else None
+    info.CheckedInDate = convert_net_datetime(checked_in_date.LocalTime) if checked_in_date else None
 
     # IsDirty
-    try:
-        info["IsDirty"] = bool(analysis.IsDirty) if hasattr(analysis, "IsDirty") else False
-    except Exception:
-        info["IsDirty"] = False
+    info.IsDirty = bool(analysis.IsDirty) if schema["IsDirty"] else False
 
     # Creation and modification info
-    info["CreateDate"] = None
-    info["CreatedBy"] = None
-    info["ModifyDate"] = None
-    info["ModifiedBy"] = None
-    try:
-        if hasattr(analysis, "CreationDate") and analysis.CreationDate:
-            info["CreateDate"] = convert_net_datetime(analysis.CreationDate.LocalTime)
-        if hasattr(analysis, "CreatedBy"):
-            info["CreatedBy"] = safe_str(analysis.CreatedBy)
-        if hasattr(analysis, "ModifyDate") and analysis.ModifyDate:
-            info["ModifyDate"] = convert_net_datetime(analysis.ModifyDate.LocalTime)
-        if hasattr(analysis, "ModifiedBy"):
-            info["ModifiedBy"] = safe_str(analysis.ModifiedBy)
-    except Exception:
-        pass
-
-    # Extraction timestamp
-    info["ExtractedAt"] = extraction_time
+    creation_date = analysis.CreationDate
+    info.CreateDate = convert_net_datetime(creation_date.LocalTime) if creation_date else None
+    info.CreatedBy = safe_str(analysis.CreatedBy)
+    modify_date = analysis.ModifyDate
+    info.ModifyDate = convert_net_datetime(modify_date.LocalTime) if modify_date else None
+    info.ModifiedBy = safe_str(analysis.ModifiedBy)
 
     return info
 
 
-def extract_analysis_info(analysis: Any, sdk: Any, extraction_time: str, conn: AFDatabaseConnection) -> dict[str, Any]:
+# Raw SDK access only needs the database name, so it is the implementation itself
+extract_analysis_info_raw = _extract_analysis_info_impl
+
+
+def extract_analysis_info(analysis: Any, sdk: Any, extraction_time: str, conn: AFDatabaseConnection) -> AnalysisRecord:
     """
     Extract comprehensive information from an AF Analysis object.
 
     Args:
         analysis: AFAnalysis object
-        sdk: SDK manager instance
+        sdk: SDK manager instance (unused; kept for compatibility)
         extraction_time: ISO timestamp of extraction
         conn: AF Database connection
 
     Returns:
-        Dictionary with all analysis attributes and properties in the specified format.
+        AnalysisRecord with all analysis attributes and properties.
     """
-    info: dict[str, Any] = {}
-
-    # Basic identification
-    info["Name"] = safe_str(analysis.Name)
-    info["Id"] = safe_str(analysis.ID) if hasattr(analysis, "ID") else None
-    info["Description"] = safe_str(analysis.Description) if analysis.Description else None
-
-    # Analysis Rule Plugin Name
-    try:
-        if hasattr(analysis, "AnalysisRulePlugIn") and analysis.AnalysisRulePlugIn:
-            info["AnalysisRulePlugInName"] = safe_str(analysis.AnalysisRulePlugIn.Name)
-        else:
-            info["AnalysisRulePlugInName"] = None
-    except Exception:
-        info["AnalysisRulePlugInName"] = None
-
-    # Analysis Type (derived from plugin name)
-    info["AnalysisType"] = info.get("AnalysisRulePlugInName")
-
-    # Element Path (Target element)
-    try:
-        if hasattr(analysis, "Target") and analysis.Target:
-            info["ElementPath"] = safe_str(analysis.Target.GetPath())
-        else:
-            info["ElementPath"] = None
-    except Exception:
-        info["ElementPath"] = None
-
-    # Get Plant Name and Category from element path
-    element_path = info.get("ElementPath") or ""
-    info["PlantName"] = extract_plant_name(element_path)
-    info["PlantCategory"] = determine_plant_category(element_path)
-
-    # Template Name
-    try:
-        if hasattr(analysis, "Template") and analysis.Template:
-            info["TemplateName"] = safe_str(analysis.Template.Name)
-        else:
-            info["TemplateName"] = None
-    except Exception:
-        info["TemplateName"] = None
-
-    # Event Frame Template Name (if applicable)
-    info["EventFrameTemplateName"] = None
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            ar = analysis.AnalysisRule
-            # Try to get event frame template from config string
-            if hasattr(ar, "ConfigString"):
-                config_str = safe_str(ar.ConfigString)
-                if config_str and "EFTNAME=" in config_str:
-                    # Extract template name from config
-                    parts = config_str.split("EFTNAME=")
-                    if len(parts) > 1:
-                        eft_name = parts[1].split(";")[0]
-                        info["EventFrameTemplateName"] = eft_name
-    except Exception:
-        pass
-
-    # Config Expression
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            info["ConfigExpression"] = safe_str(analysis.AnalysisRule.ConfigString) if hasattr(analysis.AnalysisRule, "ConfigString") else None
-        else:
-            info["ConfigExpression"] = None
-    except Exception:
-        info["ConfigExpression"] = None
-
-    # Status and Enabled - AFAnalysis uses Status property with AFStatus enum
-    try:
-        if hasattr(analysis, "Status"):
-            status = analysis.Status
-            # AFStatus enum: Enabled = 0, Disabled = 1
-            status_str = safe_str(status)
-            info["IsEnabled"] = status_str == "Enabled" if status_str else None
-            log_verbose(f"      -> Status: {status_str}, IsEnabled: {info['IsEnabled']}")
-        else:
-            info["IsEnabled"] = None
-            log_verbose(f"      -> Status property not found")
-    except Exception as e:
-        info["IsEnabled"] = None
-        log_verbose(f"      -> Error getting Status: {e}")
-
-    # Schedule Type / Time Rule
-    try:
-        if hasattr(analysis, "TimeRule") and analysis.TimeRule:
-            tr = analysis.TimeRule
-            if hasattr(tr, "TimeRulePlugIn") and tr.TimeRulePlugIn:
-                info["ScheduleType"] = safe_str(tr.TimeRulePlugIn.Name)
-            else:
-                info["ScheduleType"] = safe_str(tr.Name) if hasattr(tr, "Name") else None
-            log_verbose(f"      -> ScheduleType: {info['ScheduleType']}")
-        else:
-            info["ScheduleType"] = None
-    except Exception:
-        info["ScheduleType"] = None
-
-    # Start Trigger / End Trigger / TrueFor / Severity (for event frame analyses)
-    info["StartTrigger"] = None
-    info["EndTrigger"] = None
-    info["TrueFor"] = None
-    info["TrueForEnding"] = None
-    info["Severity"] = None
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            ar = analysis.AnalysisRule
-            log_verbose(f"      -> AnalysisRule type: {type(ar).__name__}")
-
-            # List available attributes on the rule for debugging
-            ar_attrs = [attr for attr in dir(ar) if not attr.startswith('_')]
-            log_verbose(f"      -> AnalysisRule attrs (first 15): {ar_attrs[:15]}")
-
-            # Try to get Expression (StartTrigger)
-            if hasattr(ar, "Expression"):
-                info["StartTrigger"] = safe_str(ar.Expression)
-
-            # For EventFrame type analyses, the AnalysisRule might be AFEventFrameGenerationRule
-            # Try accessing properties directly on the rule
-            if hasattr(ar, "TrueFor"):
-                true_for_raw = ar.TrueFor
-                log_verbose(f"      -> TrueFor raw: {true_for_raw}, type: {type(true_for_raw)}")
-                if true_for_raw:
-                    # TrueFor is typically a TimeSpan
-                    if hasattr(true_for_raw, "TotalSeconds"):
-                        total_seconds = true_for_raw.TotalSeconds
-                        log_verbose(f"      -> TrueFor TotalSeconds: {total_seconds}")
-                        if total_seconds > 0:
-                            info["TrueFor"] = safe_str(true_for_raw)
-                    else:
-                        info["TrueFor"] = safe_str(true_for_raw)
-            else:
-                log_verbose(f"      -> TrueFor attribute not found on AnalysisRule")
-
-            if hasattr(ar, "TrueForEnding") and ar.TrueForEnding:
-                true_for_ending = ar.TrueForEnding
-                if hasattr(true_for_ending, "TotalSeconds"):
-                    total_seconds = true_for_ending.TotalSeconds
-                    if total_seconds > 0:
-                        info["TrueForEnding"] = safe_str(true_for_ending)
-                else:
-                    info["TrueForEnding"] = safe_str(true_for_ending)
-
-            # Try to get EndTrigger
-            if hasattr(ar, "EndExpression"):
-                info["EndTrigger"] = safe_str(ar.EndExpression)
-
-            # Try to get Severity from the rule
-            if hasattr(ar, "Severity"):
-                severity_raw = ar.Severity
-                log_verbose(f"      -> Severity raw: {severity_raw}, type: {type(severity_raw)}")
-                if severity_raw:
-                    info["Severity"] = safe_str(severity_raw)
-            else:
-                log_verbose(f"      -> Severity attribute not found on AnalysisRule")
-
-            # Also try to get from nested PlugIn config if available
-            if hasattr(ar, "PlugIn") and ar.PlugIn:
-                plugin = ar.PlugIn
-                plugin_name = safe_str(plugin.Name) if hasattr(plugin, "Name") else None
-                log_verbose(f"      -> PlugIn: {plugin_name}")
-                if plugin_name and "EventFrame" in plugin_name:
-                    # This is an event frame generation rule
-                    if hasattr(ar, "GetConfiguration"):
-                        try:
-                            config = ar.GetConfiguration()
-                            log_verbose(f"      -> Got configuration: {type(config)}")
-                            if config and hasattr(config, "TrueFor"):
-                                info["TrueFor"] = safe_str(config.TrueFor)
-                                log_verbose(f"      -> TrueFor from config: {info['TrueFor']}")
-                            if config and hasattr(config, "Severity"):
-                                info["Severity"] = safe_str(config.Severity)
-                                log_verbose(f"      -> Severity from config: {info['Severity']}")
-                        except Exception as cfg_e:
-                            log_verbose(f"      -> Error getting config: {cfg_e}")
-        else:
-            log_verbose(f"      -> No AnalysisRule found")
-    except Exception as e:
-        log_verbose(f"      -> Error extracting rule properties: {e}")
-
-    log_verbose(f"      -> Final: IsEnabled={info['IsEnabled']}, TrueFor={info['TrueFor']}, Severity={info['Severity']}")
-
-    # Input/Output counts
-    info["InputCount"] = 0
-    info["OutputCount"] = 0
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            ar = analysis.AnalysisRule
-            if hasattr(ar, "VariableMapping"):
-                info["InputCount"] = len(list(ar.VariableMapping)) if ar.VariableMapping else 0
-            if hasattr(ar, "Outputs"):
-                info["OutputCount"] = len(list(ar.Outputs)) if ar.Outputs else 0
-    except Exception:
-        pass
-
-    # Rollup information
-    info["RollupType"] = None
-    info["RollupSource"] = None
-    info["RollupInputAttribute"] = None
-    info["RollupOutputAttribute"] = None
-    try:
-        if hasattr(analysis, "AnalysisRule") and analysis.AnalysisRule:
-            ar = analysis.AnalysisRule
-            if hasattr(ar, "RollupType"):
-                info["RollupType"] = safe_str(ar.RollupType)
-            if hasattr(ar, "RollupSource"):
-                info["RollupSource"] = safe_str(ar.RollupSource)
-    except Exception:
-        pass
-
-    # Severity (if not already set from AnalysisRule)
-    if info.get("Severity") is None:
-        try:
-            if hasattr(analysis, "Severity") and analysis.Severity:
-                info["Severity"] = safe_str(analysis.Severity)
-        except Exception:
-            pass
-
-    # Version
-    try:
-        info["Version"] = int(analysis.Version) if hasattr(analysis, "Version") else 0
-    except Exception:
-        info["Version"] = 0
-
-    # Checkout information
-    info["IsCheckedOut"] = False
-    info["CheckedOutBy"] = None
-    info["CheckedInDate"] = None
-    try:
-        if hasattr(analysis, "IsCheckedOut"):
-            info["IsCheckedOut"] = bool(analysis.IsCheckedOut)
-        if hasattr(analysis, "CheckedOutBy"):
-            info["CheckedOutBy"] = safe_str(analysis.CheckedOutBy)
-        if hasattr(analysis, "CheckedInDate") and analysis.CheckedInDate:
-            info["CheckedInDate"] = convert_net_datetime(analysis.CheckedInDate.LocalTime)
-    except Exception:
-        pass
-
-    # IsDirty
-    try:
-        info["IsDirty"] = bool(analysis.IsDirty) if hasattr(analysis, "IsDirty") else False
-    except Exception:
-        info["IsDirty"] = False
-
-    # Creation and modification info
-    info["CreateDate"] = None
-    info["CreatedBy"] = None
-    info["ModifyDate"] = None
-    info["ModifiedBy"] = None
-    try:
-        if hasattr(analysis, "CreationDate") and analysis.CreationDate:
-            info["CreateDate"] = convert_net_datetime(analysis.CreationDate.LocalTime)
-        if hasattr(analysis, "CreatedBy"):
-            info["CreatedBy"] = safe_str(analysis.CreatedBy)
-        if hasattr(analysis, "ModifyDate") and analysis.ModifyDate:
-            info["ModifyDate"] = convert_net_datetime(analysis.ModifyDate.LocalTime)
-        if hasattr(analysis, "ModifiedBy"):
-            info["ModifiedBy"] = safe_str(analysis.ModifiedBy)
-    except Exception:
-        pass
-
-    # Extraction timestamp
-    info["ExtractedAt"] = extraction_time
-
-    return info
+    return _extract_analysis_info_impl(analysis, extraction_time, str(conn.database.Name))
 
 
+@functools.lru_cache(maxsize=8192)
 def extract_plant_name(element_path: str) -> str | None:
     """Extract plant name from element path."""
     if not element_path:
@@ -754,74 +719,90 @@ def extract_plant_name(element_path: str) -> str | None:
         return None
 
 
+@functools.lru_cache(maxsize=8192)
 def determine_plant_category(element_path: str) -> int | None:
     """Determine plant category from element path."""
     if not element_path:
         return None
-    try:
-        path_lower = element_path.lower()
-        if "hydro" in path_lower:
-            return 1  # Hydro
-        elif "thermal" in path_lower or "coal" in path_lower:
-            return 2  # Thermal
-        elif "solar" in path_lower or "ges" in path_lower:
-            return 3  # Solar
-        elif "wind" in path_lower or "res" in path_lower:
-            return 4  # Wind
-        elif "gas" in path_lower:
-            return 5  # Gas
-        else:
-            return 0  # Unknown
-    except Exception:
-        return None
+    # Every keyword occurrence is found in one pass; the lowest category wins,
+    # matching the precedence of the keywords in _PLANT_CATEGORIES
+    return min(
+        (_PLANT_CATEGORIES[keyword] for keyword in _PLANT_KEYWORD_RE.findall(element_path.lower())),
+        default=0,  # Unknown
+    )
 
 
-def search_analyses_in_elements(conn: AFDatabaseConnection, sdk: Any, extraction_time: str) -> list[dict[str, Any]]:
+def search_analyses_in_elements(conn: AFDatabaseConnection, sdk: Any, extraction_time: str) -> Iterator[AnalysisRecord]:
     """
-    Search for analyses by traversing elements in the database.
+    Search for analyses in the database without using its Analyses collection.
+
+    A single database-wide AFAnalysisSearch is tried first. If the search API
+    is unavailable, the element hierarchy is walked with an explicit stack
+    instead of recursion. Analyses are yielded as they are found so they can
+    be written out immediately.
 
     Args:
         conn: AF Database connection
         sdk: SDK manager instance
         extraction_time: ISO timestamp of extraction
 
-    Returns:
-        List of analysis dictionaries.
+    Yields:
+        Analysis records.
     """
-    analyses_list = []
-
-    def traverse_elements(elements: Any, depth: int = 0) -> None:
-        """Recursively traverse elements to find analyses."""
-        for element in elements:
-            # Check for analyses on this element
+    try:
+        AFAnalysisSearch = _get_clr_type(sdk, "OSIsoft.AF.Search", "AFAnalysisSearch")
+        search = AFAnalysisSearch(conn.database, "AnalysisSearch", [])
+    except Exception as e:
+        print(f"Analysis search unavailable, traversing elements instead: {e}")
+    else:
+        print("Searching all analyses in the database...")
+        # fullLoad=True brings the analyses back fully loaded in one call
+        for analysis in search.FindAnalyses(0, True):
             try:
-                if hasattr(element, "Analyses") and element.Analyses:
-                    for analysis in element.Analyses:
-                        try:
-                            analysis_info = extract_analysis_info(analysis, sdk, extraction_time, conn)
-                            analyses_list.append(analysis_info)
-                            print(f"  {'  ' * depth}Found analysis: {analysis_info['Name']} on element: {element.Name}")
-                        except Exception as e:
-                            print(f"  {'  ' * depth}Error extracting analysis: {e}")
+                analysis_info = extract_analysis_info(analysis, sdk, extraction_time, conn)
             except Exception as e:
-                print(f"  {'  ' * depth}Error accessing analyses on {element.Name}: {e}")
-
-            # Recurse into child elements
-            try:
-                if element.Elements and element.Elements.Count > 0:
-                    traverse_elements(element.Elements, depth + 1)
-            except Exception:
-                pass
+                print(f"  Error extracting analysis: {e}")
+                continue
+            print(f"  Found analysis: {analysis_info.Name}")
+            yield analysis_info
+        return
 
     # Start traversal from root elements
     try:
         root_elements = conn.database.Elements
         print(f"Traversing {root_elements.Count} root elements...")
-        traverse_elements(root_elements)
+        # Depth-first walk in the same order as a recursive traversal
+        stack: list[tuple[Any, int]] = [(element, 0) for element in reversed(list(root_elements))]
     except Exception as e:
         print(f"Error traversing elements: {e}")
+        return
 
-    return analyses_list
+    while stack:
+        element, depth = stack.pop()
+        indent = "  " * depth
+
+        # Check for analyses on this element
+        try:
+            analyses = getattr(element, "Analyses", None)
+            if analyses:
+                for analysis in analyses:
+                    try:
+                        analysis_info = extract_analysis_info(analysis, sdk, extraction_time, conn)
+                    except Exception as e:
+                        print(f"  {indent}Error extracting analysis: {e}")
+                        continue
+                    print(f"  {indent}Found analysis: {analysis_info.Name} on element: {element.Name}")
+                    yield analysis_info
+        except Exception as e:
+            print(f"  {indent}Error accessing analyses on {element.Name}: {e}")
+
+        # Queue child elements
+        try:
+            children = element.Elements
+            if children and children.Count > 0:
+                stack.extend((child, depth + 1) for child in reversed(list(children)))
+        except Exception:
+            pass
 
 
 def main() -> None:
@@ -842,26 +823,23 @@ def main() -> None:
     # Extract Analyses
     print("\nExtracting AF Analyses...")
     print("-" * 40)
+    analyses_file = output_dir / "analyses.ndjson"
     try:
-        analyses = extract_analyses(AF_SERVER, AF_DATABASE)
-        print(f"\nExtracted {len(analyses)} analyses")
-
-        # Save to JSON
-        analyses_file = output_dir / "analyses.json"
-        with open(analyses_file, "w", encoding="utf-8") as f:
-            json.dump(analyses, f, indent=2, default=serialize_datetime, ensure_ascii=False)
+        # Records are streamed to the file while they are extracted
+        analyses_count = extract_analyses(AF_SERVER, analyses_file, AF_DATABASE)
+        print(f"\nExtracted {analyses_count} analyses")
         print(f"Saved analyses to: {analyses_file}")
 
     except Exception as e:
         print(f"Error extracting analyses: {e}")
         traceback.print_exc()
-        analyses = []
+        analyses_count = 0
 
     # Summary
     print("\n" + "=" * 60)
     print("Extraction Complete!")
     print("=" * 60)
-    print(f"Analyses extracted: {len(analyses)}")
+    print(f"Analyses extracted: {analyses_count}")
     print("=" * 60)
 
 
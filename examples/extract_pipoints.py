@@ -6,33 +6,149 @@ This script extracts PI Points from PI Data Archive with comprehensive attribute
 Uses Windows authentication to connect to the server.
 """
 
-import json
-import sys
+import functools
 import io
+import json
 import logging
+import sys
 import traceback
-from datetime import datetime, timezone
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-# Fix encoding for Windows console
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
-
 # Add pipolars to path
 sys.path.insert(0, str(Path(__file__).parent / "pipolars" / "src"))
 
+from pipolars.connection.sdk import get_sdk_manager
 from pipolars.connection.server import PIServerConnection
 from pipolars.core.config import PIServerConfig
 
-# Global verbose flag for detailed logging
-VERBOSE_LOGGING = True
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
+# Fix encoding for Windows console
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
 
-def log_verbose(message: str) -> None:
-    """Print message if verbose logging is enabled."""
-    if VERBOSE_LOGGING:
-        print(message)
+logger = logging.getLogger(__name__)
+
+# Number of points whose attributes are loaded per server call
+POINT_BATCH_SIZE = 500
+
+# Points extracted concurrently; keep below the PI server's connection limits
+MAX_POINT_WORKERS = 16
+
+# Output file buffer; records are appended as bytes and flushed in large writes
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# .NET DateTime.Ticks are 100 ns intervals since 0001-01-01 00:00:00
+_NET_EPOCH = datetime(1, 1, 1)
+_TICKS_PER_MILLISECOND = 10_000
+
+
+# Standard PI point attributes to retrieve, in output order
+POINT_ATTRIBUTES: tuple[str, ...] = (
+    "pointid",
+    "tag",
+    "pointtype",
+    "pointtypex",
+    "descriptor",
+    "engunits",
+    "zero",
+    "span",
+    "displaydigits",
+    "typicalvalue",
+    "pointsource",
+    "sourcetag",
+    "step",
+    "future",
+    "compressing",
+    "compdev",
+    "compdevpercent",
+    "compmin",
+    "compmax",
+    "excdev",
+    "excdevpercent",
+    "excmin",
+    "excmax",
+    "filtercode",
+    "shutdown",
+    "archiving",
+    "scan",
+    "location1",
+    "location2",
+    "location3",
+    "location4",
+    "location5",
+    "userint1",
+    "userint2",
+    "userreal1",
+    "userreal2",
+    "digitalset",
+    "ptclassname",
+    "ptclassid",
+    "ptsecurity",
+    "datasecurity",
+    "squession",
+    "totalcode",
+    "exdesc",
+    "instrumenttag",
+    "creationdate",
+    "creator",
+    "changedate",
+    "changer",
+    "ptowner",
+    "ptgroup",
+    "ptaccess",
+    "recno",
+)
+
+# Marks a current value that was not read in bulk, see extract_point
+_NOT_LOADED: Any = object()
+
+# Every key of a point record, in output order; copied for each point so the
+# dict is built at its final size
+_POINT_INFO_TEMPLATE: dict[str, Any] = dict.fromkeys(
+    ("name", "id", *POINT_ATTRIBUTES, "current_value", "point_class", "server_name")
+)
+
+# Python type of each known PI point attribute; others use infer_attribute
+_COERCE: dict[str, Callable[[Any], Any]] = {
+    **dict.fromkeys(
+        (
+            "pointid", "displaydigits",
+            "compmin", "compmax", "excmin", "excmax", "filtercode",
+            "location1", "location2", "location3", "location4", "location5",
+            "userint1", "userint2", "ptclassid", "totalcode", "recno",
+        ),
+        int,
+    ),
+    **dict.fromkeys(
+        (
+            "zero", "span", "typicalvalue", "compdev", "compdevpercent",
+            "excdev", "excdevpercent", "userreal1", "userreal2",
+        ),
+        float,
+    ),
+    **dict.fromkeys(
+        ("step", "future", "compressing", "archiving", "scan", "shutdown"),
+        bool,
+    ),
+    **dict.fromkeys(
+        (
+            "tag", "pointtype", "pointtypex", "descriptor", "engunits",
+            "pointsource", "sourcetag", "digitalset", "ptclassname",
+            "ptsecurity", "datasecurity", "exdesc", "instrumenttag",
+            "creationdate", "creator", "changedate", "changer",
+            "ptowner", "ptgroup", "ptaccess",
+        ),
+        str,
+    ),
+}
 
 
 def serialize_datetime(obj: Any) -> Any:
@@ -42,198 +158,284 @@ def serialize_datetime(obj: Any) -> Any:
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+def dump_record(record: dict[str, Any]) -> bytes:
+    """Encode a record as one UTF-8 NDJSON line."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, default=serialize_datetime, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
 def convert_net_datetime(net_datetime: Any) -> datetime | None:
     """Convert a .NET DateTime to Python datetime."""
     try:
-        return datetime(
-            net_datetime.Year,
-            net_datetime.Month,
-            net_datetime.Day,
-            net_datetime.Hour,
-            net_datetime.Minute,
-            net_datetime.Second,
-            net_datetime.Millisecond * 1000,
-        )
+        # One Ticks read instead of seven field reads; truncated to milliseconds
+        return _NET_EPOCH + timedelta(milliseconds=net_datetime.Ticks // _TICKS_PER_MILLISECOND)
     except Exception:
         return None
 
 
-def extract_pi_points(pi_server: str, pattern: str = "*", max_count: int = 100000) -> list[dict[str, Any]]:
+def infer_attribute(value: Any) -> Any:
+    """
+    Convert a .NET attribute value of unknown type from its string form.
+
+    Args:
+        value: Attribute value as returned by the AF SDK (not None)
+
+    Returns:
+        A float, int or str, or ``value`` unchanged if it is not a .NET object.
+    """
+    if not hasattr(value, "ToString"):
+        return value
+    try:
+        return float(value) if "." in str(value) else int(value)
+    except (ValueError, TypeError):
+        return str(value.ToString())
+
+
+# (attribute name, converter) in output order, resolved once so the per-point
+# loop calls each cast directly
+_ATTRIBUTE_CONVERTERS: tuple[tuple[str, Callable[[Any], Any]], ...] = tuple(
+    (attr_name, _COERCE.get(attr_name, infer_attribute)) for attr_name in POINT_ATTRIBUTES
+)
+
+
+@functools.cache
+def net_point_attributes() -> Any:
+    """
+    Return POINT_ATTRIBUTES as a .NET ``List[String]``, built once.
+
+    Passing the same .NET list to every AF SDK call avoids marshalling the
+    Python sequence again for each point. Falls back to a Python list when
+    the .NET collection types cannot be loaded.
+    """
+    try:
+        get_sdk_manager().initialize()
+        from System import String
+        from System.Collections.Generic import List
+
+        net_attributes = List[String]()
+        for attr_name in POINT_ATTRIBUTES:
+            net_attributes.Add(attr_name)
+        return net_attributes
+    except Exception as e:
+        logger.debug(".NET attribute list unavailable, using Python list: %s", e)
+        return list(POINT_ATTRIBUTES)
+
+
+def load_point_batch(points: list[Any]) -> list[Any] | None:
+    """
+    Bulk-load attributes and current values for a batch of PI Points.
+
+    Each step is a single server call for the whole batch. Failures are
+    logged and ignored; the data is then fetched per point.
+
+    Args:
+        points: PIPoint objects to load
+
+    Returns:
+        Current values aligned with ``points``, or None if they could not be
+        read in bulk.
+    """
+    try:
+        PIPointList = get_sdk_manager().pi_point_list_class
+        point_list = PIPointList()
+        for point in points:
+            point_list.Add(point)
+    except Exception as e:
+        logger.warning("Bulk load unavailable, falling back to per-point: %s", e)
+        return None
+
+    try:
+        point_list.LoadAttributes(net_point_attributes())
+    except Exception as e:
+        logger.warning("Bulk attribute load failed, falling back to per-point: %s", e)
+
+    try:
+        current_values = list(point_list.CurrentValue())
+    except Exception as e:
+        logger.warning("Bulk current value read failed, falling back to per-point: %s", e)
+        return None
+    # AFValues is positional; anything else cannot be matched to the points
+    return current_values if len(current_values) == len(points) else None
+
+
+def extract_point(point: Any, current_value: Any = _NOT_LOADED) -> dict[str, Any] | None:
+    """
+    Extract attributes, current value and metadata for a single PI Point.
+
+    Args:
+        point: PIPoint object
+        current_value: The point's current AFValue if already read in bulk
+
+    Returns:
+        PI Point dictionary, an error record if extraction failed, or None
+        if not even the point name could be read.
+    """
+    try:
+        point_info = _POINT_INFO_TEMPLATE.copy()
+        point_info["name"] = str(point.Name)
+        point_info["id"] = int(point.ID) if hasattr(point, "ID") else None
+
+        logger.debug("[Extracting] %s", point_info["name"])
+
+        # Get all available attributes
+        try:
+            attrs = point.GetAttributes(net_point_attributes())
+
+            # Map attributes to dictionary; the key set is read from .NET once
+            present = set(attrs.Keys)
+            for attr_name, convert in _ATTRIBUTE_CONVERTERS:
+                if attr_name in present:
+                    value = attrs[attr_name]
+                    if value is not None:
+                        # A value that does not fit the attribute's type
+                        # (e.g. zero/span of a digital point) must not lose
+                        # the remaining attributes
+                        try:
+                            point_info[attr_name] = convert(value)
+                        except Exception:
+                            point_info[attr_name] = infer_attribute(value)
+
+        except Exception as e:
+            point_info["attributes_error"] = str(e)
+            logger.debug("Error getting attributes of %s: %s", point_info["name"], e)
+
+        # Get current value info
+        try:
+            if current_value is _NOT_LOADED:
+                current_value = point.CurrentValue()
+            if current_value:
+                cv_val = current_value.Value
+                try:
+                    cv_val = float(cv_val)
+                except (ValueError, TypeError):
+                    cv_val = str(cv_val) if cv_val else None
+
+                point_info["current_value"] = {
+                    "value": cv_val,
+                    "timestamp": convert_net_datetime(current_value.Timestamp.LocalTime),
+                    "is_good": bool(current_value.IsGood),
+                }
+        except Exception:
+            point_info["current_value"] = None
+
+        # Point class info
+        try:
+            if hasattr(point, "PointClass") and point.PointClass:
+                point_info["point_class"] = {
+                    "name": str(point.PointClass.Name) if hasattr(point.PointClass, "Name") else None,
+                    "id": int(point.PointClass.ID) if hasattr(point.PointClass, "ID") else None,
+                }
+        except Exception:
+            point_info["point_class"] = None
+
+        # Server info
+        try:
+            if hasattr(point, "Server") and point.Server:
+                point_info["server_name"] = str(point.Server.Name)
+        except Exception:
+            point_info["server_name"] = None
+
+        return point_info
+
+    except Exception as e:
+        print(f"  Error extracting point: {e}")
+        # Add basic info even if detailed extraction fails
+        try:
+            error_info = {
+                "name": str(point.Name) if hasattr(point, "Name") else "Unknown",
+                "error": str(e),
+            }
+        except Exception:
+            return None
+        return error_info
+
+
+def iter_pi_points(pi_server: str, pattern: str = "*", max_count: int = 100000) -> Iterator[dict[str, Any]]:
     """
     Extract all PI Points from the PI Data Archive with comprehensive attributes.
 
+    Points are yielded one at a time while the server connection is open, so
+    callers can write each record out without holding the whole result set.
+
     Args:
         pi_server: PI Server name
         pattern: Tag search pattern (default: "*" for all tags)
         max_count: Maximum number of tags to retrieve
 
-    Returns:
-        List of PI Point dictionaries with all attributes and properties.
+    Yields:
+        PI Point dictionaries with all attributes and properties.
     """
     config = PIServerConfig(host=pi_server)
 
-    points_list = []
-
     with PIServerConnection(config) as conn:
         print(f"Connected to PI Server: {conn.name}")
 
         # Search for all PI points
         print(f"Searching for PI Points with pattern: {pattern}")
-        points = conn.search_points(pattern, max_count)
-        print(f"Found {len(points)} PI Points")
-
-        # List of all standard PI point attributes to retrieve
-        point_attributes = [
-            "pointid",
-            "tag",
-            "pointtype",
-            "pointtypex",
-            "descriptor",
-            "engunits",
-            "zero",
-            "span",
-            "displaydigits",
-            "typicalvalue",
-            "pointsource",
-            "sourcetag",
-            "step",
-            "future",
-            "compressing",
-            "compdev",
-            "compdevpercent",
-            "compmin",
-            "compmax",
-            "excdev",
-            "excdevpercent",
-            "excmin",
-            "excmax",
-            "filtercode",
-            "shutdown",
-            "archiving",
-            "scan",
-            "location1",
-            "location2",
-            "location3",
-            "location4",
-            "location5",
-            "userint1",
-            "userint2",
-            "userreal1",
-            "userreal2",
-            "digitalset",
-            "ptclassname",
-            "ptclassid",
-            "ptsecurity",
-            "datasecurity",
-            "squession",
-            "totalcode",
-            "exdesc",
-            "instrumenttag",
-            "creationdate",
-            "creator",
-            "changedate",
-            "changer",
-            "ptowner",
-            "ptgroup",
-            "ptaccess",
-            "recno",
-        ]
-
-        for i, point in enumerate(points):
-            try:
-                point_info: dict[str, Any] = {
-                    "name": str(point.Name),
-                    "id": int(point.ID) if hasattr(point, "ID") else None,
-                }
+        pages = conn.search_points_paged(pattern, page_size=POINT_BATCH_SIZE, max_results=max_count)
+
+        count = 0
+        with ThreadPoolExecutor(max_workers=MAX_POINT_WORKERS) as executor:
+            # Pages are pulled from the server while earlier ones are extracted
+            for chunk in pages:
+                # One server call loads the attributes of the whole chunk into
+                # each PIPoint's cache and one more reads all current values
+                current_values = load_point_batch(chunk)
+
+                # AF SDK calls release the GIL, so points are extracted in
+                # parallel; map() keeps the output in search order
+                if current_values is None:
+                    point_infos = executor.map(extract_point, chunk)
+                else:
+                    point_infos = executor.map(extract_point, chunk, current_values)
+                for point_info in point_infos:
+                    if point_info is not None:
+                        yield point_info
+
+                    count += 1
+                    if count % 500 == 0:
+                        print(f"  Processed {count} points...")
+
+        print(f"Found {count} PI Points")
+
+    print("Disconnected from PI Server")
 
-                log_verbose(f"  [Extracting] {point_info['name']}")
 
-                # Get all available attributes
-                try:
-                    attrs = point.GetAttributes(point_attributes)
+def extract_pi_points(pi_server: str, pattern: str = "*", max_count: int = 100000) -> list[dict[str, Any]]:
+    """
+    Extract all PI Points from the PI Data Archive into a list.
 
-                    # Map attributes to dictionary
-                    for attr_name in point_attributes:
-                        try:
-                            if attrs.ContainsKey(attr_name):
-                                value = attrs[attr_name]
-                                # Convert .NET types to Python types
-                                if value is not None:
-                                    if hasattr(value, "ToString"):
-                                        # Check if it's a numeric type
-                                        try:
-                                            str_val = str(value)
-                                            if "." in str_val:
-                                                value = float(value)
-                                            else:
-                                                value = int(value)
-                                        except (ValueError, TypeError):
-                                            value = str(value.ToString())
-                                    else:
-                                        value = value
-                                point_info[attr_name] = value
-                            else:
-                                point_info[attr_name] = None
-                        except Exception:
-                            point_info[attr_name] = None
+    Convenience wrapper around :func:`iter_pi_points` for small extractions.
 
-                except Exception as e:
-                    point_info["attributes_error"] = str(e)
-                    log_verbose(f"    -> Error getting attributes: {e}")
+    Args:
+        pi_server: PI Server name
+        pattern: Tag search pattern (default: "*" for all tags)
+        max_count: Maximum number of tags to retrieve
 
-                # Get current value info
-                try:
-                    current_value = point.CurrentValue()
-                    if current_value:
-                        cv_val = current_value.Value
-                        try:
-                            cv_val = float(cv_val)
-                        except (ValueError, TypeError):
-                            cv_val = str(cv_val) if cv_val else None
-
-                        point_info["current_value"] = {
-                            "value": cv_val,
-                            "timestamp": convert_net_datetime(current_value.Timestamp.LocalTime),
-                            "is_good": bool(current_value.IsGood),
-                        }
-                except Exception:
-                    point_info["current_value"] = None
-
-                # Point class info
-                try:
-                    if hasattr(point, "PointClass") and point.PointClass:
-                        point_info["point_class"] = {
-                            "name": str(point.PointClass.Name) if hasattr(point.PointClass, "Name") else None,
-                            "id": int(point.PointClass.ID) if hasattr(point.PointClass, "ID") else None,
-                        }
-                except Exception:
-                    point_info["point_class"] = None
-
-                # Server info
-                try:
-                    if hasattr(point, "Server") and point.Server:
-                        point_info["server_name"] = str(point.Server.Name)
-                except Exception:
-                    point_info["server_name"] = None
+    Returns:
+        List of PI Point dictionaries with all attributes and properties.
+    """
+    return list(iter_pi_points(pi_server, pattern, max_count))
 
-                points_list.append(point_info)
 
-                if (i + 1) % 500 == 0:
-                    print(f"  Processed {i + 1}/{len(points)} points...")
+def write_ndjson(records: Iterable[dict[str, Any]], path: Path) -> int:
+    """
+    Write records to ``path`` as NDJSON (one JSON object per line).
 
-            except Exception as e:
-                print(f"  Error extracting point: {e}")
-                # Add basic info even if detailed extraction fails
-                try:
-                    points_list.append({
-                        "name": str(point.Name) if hasattr(point, "Name") else "Unknown",
-                        "error": str(e),
-                    })
-                except Exception:
-                    pass
+    Args:
+        records: Records to write; consumed lazily
+        path: Output file path
 
-    print("Disconnected from PI Server")
-    return points_list
+    Returns:
+        Number of records written.
+    """
+    count = 0
+    with path.open("wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+        for record in records:
+            f.write(dump_record(record))
+            count += 1
+    return count
 
 
 def main() -> None:
@@ -252,33 +454,31 @@ def main() -> None:
     # Extract PI Points
     print("\nExtracting PI Points...")
     print("-" * 40)
+    points_file = output_dir / "pipoints.ndjson"
     try:
-        pi_points = extract_pi_points(PI_SERVER)
-        print(f"\nExtracted {len(pi_points)} PI Points")
-
-        # Save to JSON
-        points_file = output_dir / "pipoints.json"
-        with open(points_file, "w", encoding="utf-8") as f:
-            json.dump(pi_points, f, indent=2, default=serialize_datetime, ensure_ascii=False)
+        # Records are streamed to the file while they are extracted
+        points_count = write_ndjson(iter_pi_points(PI_SERVER), points_file)
+        print(f"\nExtracted {points_count} PI Points")
         print(f"Saved PI Points to: {points_file}")
 
     except Exception as e:
         print(f"Error extracting PI Points: {e}")
         traceback.print_exc()
-        pi_points = []
+        points_count = 0
 
     # Summary
     print("\n" + "=" * 60)
     print("Extraction Complete!")
     print("=" * 60)
-    print(f"PI Points extracted: {len(pi_points)}")
+    print(f"PI Points extracted: {points_count}")
     print("=" * 60)
 
 
 if __name__ == "__main__":
     # Configure logging to file
+    # INFO by default; set to DEBUG for a per-point trace
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.FileHandler("pipoints_extraction.log", mode="w", encoding="utf-8"),
@@ -289,5 +489,5 @@ if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        logging.exception(f"Fatal error: {e}")
+        logging.exception("Fatal error: %s", e)
         raise
@@ -7,13 +7,14 @@ data as Polars DataFrames.
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Any
 
 import polars as pl
 
 from pipolars.api.query import PIQuery
 from pipolars.cache.storage import CacheBackendBase, get_cache_backend
-from pipolars.cache.strategies import TTLStrategy
+from pipolars.cache.strategies import RangeSubsetStrategy, TTLStrategy
 from pipolars.connection.af_database import AFDatabaseConnection
 from pipolars.connection.server import PIServerConnection
 from pipolars.core.config import PIConfig, PIServerConfig
@@ -101,6 +102,7 @@ class PIClient:
         # Initialize cache
         self._cache: CacheBackendBase | None = None
         self._cache_strategy: TTLStrategy | None = None
+        self._range_strategy: RangeSubsetStrategy | None = None
         if enable_cache and self._config.cache.backend.value != "none":
             self._cache = get_cache_backend(self._config.cache)
             if self._cache:
@@ -108,6 +110,10 @@ class PIClient:
                     self._cache,
                     ttl=self._config.cache.ttl,
                 )
+                self._range_strategy = RangeSubsetStrategy(
+                    self._cache,
+                    ttl=self._config.cache.ttl,
+                )
 
         # Initialize converters
         self._converter = PIToPolarsConverter(self._config.polars)
@@ -275,9 +281,25 @@ class PIClient:
 
         if len(tags_list) == 1:
             # Single tag
-            point_extractor = self._get_point_extractor()
-            values = point_extractor.recorded_values(tags_list[0], start, end)
-            return self._converter.values_to_dataframe(values, include_quality)
+            def fetch() -> pl.DataFrame:
+                point_extractor = self._get_point_extractor()
+                columns = point_extractor.recorded_values_columns(tags_list[0], start, end)
+                return self._converter.columns_to_dataframe(*columns, include_quality)
+
+            if (
+                self._range_strategy is not None
+                and isinstance(start, datetime)
+                and isinstance(end, datetime)
+            ):
+                # Absolute ranges can be served from a cached wider range
+                return self._range_strategy.get_range(
+                    f"recorded|{tags_list[0]}|{include_quality}",
+                    start,
+                    end,
+                    fetch,
+                    timestamp_col=self._config.polars.timestamp_column,
+                )
+            return fetch()
         else:
             # Multiple tags
             bulk_extractor = self._get_bulk_extractor()
@@ -413,10 +435,8 @@ class PIClient:
             DataFrame with time-series summary statistics
         """
         extractor = self._get_point_extractor()
-        intervals = extractor.summaries(tag, start, end, interval, summary_types)
-        return self._converter.time_series_summaries_to_dataframe(
-            {tag: intervals}
-        )
+        intervals = extractor.summaries_df(tag, start, end, interval, summary_types)
+        return self._converter.tag_summaries_frame(tag, intervals)
 
     # -------------------------------------------------------------------------
     # Tag Search and Info
@@ -452,6 +472,18 @@ class PIClient:
         self._ensure_connected()
         return self._pi_connection.point_exists(tag)  # type: ignore
 
+    def tags_exist(self, tags: list[str]) -> dict[str, bool]:
+        """Check if several tags exist with a single server round trip.
+
+        Args:
+            tags: List of PI Point names
+
+        Returns:
+            Dictionary mapping each tag to whether it exists
+        """
+        self._ensure_connected()
+        return self._pi_connection.points_exist(tags)  # type: ignore
+
     def tag_info(self, tag: str) -> dict[str, Any]:
         """Get metadata for a tag.
 
@@ -489,7 +521,9 @@ class PIClient:
 
     def clear_cache(self) -> None:
         """Clear all cached data."""
-        if self._cache:
+        if self._range_strategy:
+            self._range_strategy.clear_all()
+        elif self._cache:
             self._cache.clear()
 
     # -------------------------------------------------------------------------
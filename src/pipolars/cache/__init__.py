@@ -2,20 +2,41 @@
 
 This module provides caching mechanisms for storing and retrieving
 PI data locally to reduce server load and improve query performance.
+
+Public names are resolved lazily on first access (PEP 562), so importing
+this package does not load sqlite3 or pyarrow until a backend is used.
 """
 
-from pipolars.cache.storage import (
-    ArrowCache,
-    CacheBackendBase,
-    MemoryCache,
-    SQLiteCache,
-    get_cache_backend,
-)
-from pipolars.cache.strategies import (
-    CacheStrategy,
-    SlidingWindowStrategy,
-    TTLStrategy,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pipolars.cache.storage import (
+        ArrowCache,
+        CacheBackendBase,
+        MemoryCache,
+        SQLiteCache,
+        get_cache_backend,
+    )
+    from pipolars.cache.strategies import (
+        CacheStrategy,
+        SlidingWindowStrategy,
+        TTLStrategy,
+    )
+
+# Submodule defining each public name
+_LAZY_IMPORTS = {
+    "ArrowCache": "pipolars.cache.storage",
+    "CacheBackendBase": "pipolars.cache.storage",
+    "MemoryCache": "pipolars.cache.storage",
+    "SQLiteCache": "pipolars.cache.storage",
+    "get_cache_backend": "pipolars.cache.storage",
+    "CacheStrategy": "pipolars.cache.strategies",
+    "SlidingWindowStrategy": "pipolars.cache.strategies",
+    "TTLStrategy": "pipolars.cache.strategies",
+}
 
 __all__ = [
     "ArrowCache",
@@ -27,3 +48,19 @@ __all__ = [
     "TTLStrategy",
     "get_cache_backend",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
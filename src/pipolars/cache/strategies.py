@@ -6,6 +6,7 @@ how PI data is cached and retrieved.
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from datetime import datetime, timedelta
@@ -266,6 +267,155 @@ class SlidingWindowStrategy(CacheStrategy):
         return datetime.fromtimestamp(aligned_timestamp, tz=dt.tzinfo)
 
 
+class RangeSubsetStrategy(CacheStrategy):
+    """Caching strategy that answers time-range queries from wider cached ranges.
+
+    Each fetched range is remembered per scope (e.g. a tag and its query
+    options). A later query whose range lies within a cached range is
+    answered by filtering the cached DataFrame instead of fetching again.
+
+    Ranges must be absolute datetimes; naive datetimes are taken as local
+    time, matching how they are passed to the AF SDK. Bounds are compared
+    as local wall-clock times because that is what the timestamp column
+    holds. Ranges that end at or after the current time are not recorded,
+    since newer values may still arrive for them.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackendBase,
+        ttl: timedelta = timedelta(hours=24),
+        max_ranges: int = 32,
+    ) -> None:
+        """Initialize the range subset strategy.
+
+        Args:
+            backend: Cache backend
+            ttl: Time-to-live for cached ranges
+            max_ranges: Maximum number of ranges remembered per scope
+        """
+        super().__init__(backend)
+        self._ttl = ttl
+        self._max_ranges = max_ranges
+        self._ranges: dict[str, list[tuple[datetime, datetime, str]]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch_func: Callable[[], pl.DataFrame],
+    ) -> pl.DataFrame:
+        """Get data from cache or fetch with TTL."""
+        cached = self._backend.get(key)
+
+        if cached is not None:
+            return cached
+
+        data = fetch_func()
+        self._backend.set(key, data, self._ttl)
+        return data
+
+    def get_range(
+        self,
+        scope: str,
+        start: datetime,
+        end: datetime,
+        fetch_func: Callable[[], pl.DataFrame],
+        timestamp_col: str = "timestamp",
+    ) -> pl.DataFrame:
+        """Get data for a time range, reusing any cached range that covers it.
+
+        Args:
+            scope: Identifies the query apart from its range (tag and options)
+            start: Start time
+            end: End time
+            fetch_func: Function to fetch data for ``start`` to ``end``
+            timestamp_col: Name of the timestamp column
+
+        Returns:
+            DataFrame for the requested range
+        """
+        start = self._wall_clock(start)
+        end = self._wall_clock(end)
+
+        with self._lock:
+            candidates = [
+                entry
+                for entry in self._ranges.get(scope, [])
+                if entry[0] <= start and entry[1] >= end
+            ]
+
+        for entry in candidates:
+            cached = self._backend.get(entry[2])
+            if cached is None:
+                # Expired or evicted by the backend
+                self._forget(scope, entry)
+                continue
+            if (entry[0], entry[1]) == (start, end):
+                return cached
+            return self._slice(cached, start, end, timestamp_col)
+
+        data = fetch_func()
+        if end >= datetime.now():
+            # The range is still open; a later query must see new values
+            return data
+
+        key = self._backend.generate_key(scope, start.isoformat(), end.isoformat(), "range")
+        self._backend.set(key, data, self._ttl)
+        with self._lock:
+            ranges = self._ranges.setdefault(scope, [])
+            ranges.append((start, end, key))
+            evicted = ranges[: -self._max_ranges]
+            del ranges[: -self._max_ranges]
+        for _, _, old_key in evicted:
+            self._backend.delete(old_key)
+        return data
+
+    def clear_all(self) -> None:
+        """Clear all cached data."""
+        with self._lock:
+            self._ranges.clear()
+        super().clear_all()
+
+    def _forget(self, scope: str, entry: tuple[datetime, datetime, str]) -> None:
+        """Drop a range whose data is no longer in the backend."""
+        with self._lock:
+            ranges = self._ranges.get(scope)
+            if ranges and entry in ranges:
+                ranges.remove(entry)
+
+    @staticmethod
+    def _wall_clock(value: datetime) -> datetime:
+        """Express a bound as a naive local wall-clock time."""
+        return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+
+    @staticmethod
+    def _slice(
+        data: pl.DataFrame,
+        start: datetime,
+        end: datetime,
+        timestamp_col: str,
+    ) -> pl.DataFrame:
+        """Filter a cached DataFrame to the inclusive range ``start`` to ``end``.
+
+        The bounds are naive local wall-clock times. Timestamps hold local
+        wall-clock values labelled with the configured time zone, so the
+        bounds get the same label rather than being converted.
+        """
+        if data.is_empty() or timestamp_col not in data.columns:
+            return data
+
+        dtype = data.schema[timestamp_col]
+        time_zone = getattr(dtype, "time_zone", None)
+        lower: pl.Expr = pl.lit(start)
+        upper: pl.Expr = pl.lit(end)
+        if time_zone:
+            lower = lower.dt.replace_time_zone(time_zone)
+            upper = upper.dt.replace_time_zone(time_zone)
+
+        return data.filter(pl.col(timestamp_col).is_between(lower, upper))
+
+
 class SmartCacheStrategy(CacheStrategy):
     """Smart caching strategy that adapts based on query patterns.
 
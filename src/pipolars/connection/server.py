@@ -7,8 +7,9 @@ handling connection lifecycle, authentication, and server discovery.
 from __future__ import annotations
 
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
+from itertools import islice
 from typing import Any
 
 from pipolars.connection.sdk import get_sdk_manager
@@ -137,7 +138,7 @@ class PIServerConnection:
             finally:
                 self._server = None
                 self._connected = False
-                self._point_cache.clear()
+                self.clear_point_cache()
 
     def __enter__(self) -> PIServerConnection:
         """Context manager entry."""
@@ -195,9 +196,18 @@ class PIServerConnection:
                 details={"error": str(e)},
             ) from e
 
+    def clear_point_cache(self) -> None:
+        """Forget all cached PIPoint handles.
+
+        Subsequent lookups resolve points from the server again.
+        """
+        self._point_cache.clear()
+
     def get_points(self, tag_names: list[str]) -> list[Any]:
         """Get multiple PI Points by name.
 
+        Points not already cached are resolved with a single server call.
+
         Args:
             tag_names: List of PI Point names
 
@@ -208,23 +218,79 @@ class PIServerConnection:
             PIPointNotFoundError: If any point doesn't exist
             PIConnectionError: If not connected
         """
-        points = []
-        not_found = []
-
-        for tag_name in tag_names:
-            try:
-                point = self.get_point(tag_name)
-                points.append(point)
-            except PIPointNotFoundError:
-                not_found.append(tag_name)
-
+        not_found = self.cache_points(tag_names)
         if not_found:
             raise PIPointNotFoundError(
                 not_found[0] if len(not_found) == 1 else f"{len(not_found)} tags",
                 server=self.name,
             )
 
-        return points
+        return [self._point_cache[tag_name] for tag_name in tag_names]
+
+    def cache_points(self, tag_names: list[str]) -> list[str]:
+        """Resolve points that are not cached yet with a single server call.
+
+        Names already in the point cache cost no server round trip.
+
+        Args:
+            tag_names: List of PI Point names
+
+        Returns:
+            Names that could not be found
+
+        Raises:
+            PIConnectionError: If not connected or the lookup fails
+        """
+        missing = [tag_name for tag_name in tag_names if tag_name not in self._point_cache]
+        if not missing:
+            return []
+
+        found = self._find_points(missing)
+        not_found = []
+        for tag_name in missing:
+            point = found.get(tag_name.casefold())
+            if point is None:
+                not_found.append(tag_name)
+            else:
+                self._point_cache[tag_name] = point
+        return not_found
+
+    def _find_points(self, tag_names: list[str]) -> dict[str, Any]:
+        """Resolve PI Points by name with a single FindPIPoints call.
+
+        Args:
+            tag_names: List of PI Point names
+
+        Returns:
+            Found PIPoint objects keyed by case-folded name (PI Point names
+            are case-insensitive)
+
+        Raises:
+            PIConnectionError: If not connected or the lookup fails
+        """
+        if not self.is_connected:
+            raise PIConnectionError(
+                "Not connected to PI Server",
+                server=self._config.host,
+            )
+
+        try:
+            # Pass a .NET List[String] so the IEnumerable<string> overload binds
+            List = self._sdk.get_type("System.Collections.Generic", "List")
+            String = self._sdk.get_type("System", "String")
+            names = List[String]()
+            for tag_name in tag_names:
+                names.Add(tag_name)
+
+            PIPoint = self._sdk.pi_point_class
+            found = PIPoint.FindPIPoints(self._server, names, None)
+            return {str(point.Name).casefold(): point for point in found}
+        except Exception as e:
+            raise PIConnectionError(
+                f"Failed to look up PI Points: {e}",
+                server=self._config.host,
+                details={"error": str(e)},
+            ) from e
 
     def search_points(
         self,
@@ -240,6 +306,34 @@ class PIServerConnection:
         Returns:
             List of matching PIPoint objects
         """
+        return [
+            point
+            for page in self.search_points_paged(query, max_results=max_results)
+            for point in page
+        ]
+
+    def search_points_paged(
+        self,
+        query: str,
+        page_size: int = 1000,
+        max_results: int | None = None,
+    ) -> Iterator[list[Any]]:
+        """Search for PI Points matching a pattern, yielding pages of results.
+
+        The server-side enumeration is consumed lazily, so callers can start
+        processing the first page before the search has completed.
+
+        Args:
+            query: Search pattern (supports wildcards like "*" and "?")
+            page_size: Number of points per page
+            max_results: Maximum number of results to return, or None for all
+
+        Yields:
+            Lists of at most ``page_size`` matching PIPoint objects
+
+        Raises:
+            PIConnectionError: If not connected or the search fails
+        """
         if not self.is_connected:
             raise PIConnectionError(
                 "Not connected to PI Server",
@@ -249,17 +343,14 @@ class PIServerConnection:
         try:
             PIPoint = self._sdk.pi_point_class
 
-            # Use PIPoint.FindPIPoints for pattern matching
-            points = PIPoint.FindPIPoints(self._server, query, None, None)
-
-            # Convert to list and limit results
-            result = []
-            for i, point in enumerate(points):
-                if i >= max_results:
-                    break
-                result.append(point)
+            # Use PIPoint.FindPIPoints for pattern matching; the returned
+            # IEnumerable is iterated without materializing it
+            points = iter(PIPoint.FindPIPoints(self._server, query, None, None))
+            if max_results is not None:
+                points = islice(points, max_results)
 
-            return result
+            while page := list(islice(points, page_size)):
+                yield page
 
         except Exception as e:
             raise PIConnectionError(
@@ -282,6 +373,32 @@ class PIServerConnection:
         except PIPointNotFoundError:
             return False
 
+    def points_exist(self, tag_names: list[str]) -> dict[str, bool]:
+        """Check which of several PI Points exist with a single server call.
+
+        Points that are found are added to the point cache.
+
+        Args:
+            tag_names: List of PI Point names
+
+        Returns:
+            Mapping of each requested name to whether the point exists
+
+        Raises:
+            PIConnectionError: If not connected or the lookup fails
+        """
+        if not tag_names:
+            return {}
+
+        found_by_name = self._find_points(tag_names)
+        result = {}
+        for tag_name in tag_names:
+            point = found_by_name.get(tag_name.casefold())
+            if point is not None:
+                self._point_cache[tag_name] = point
+            result[tag_name] = point is not None
+        return result
+
     @classmethod
     def list_servers(cls) -> list[str]:
         """List all known PI Servers.
@@ -9,6 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, IntEnum
+from functools import lru_cache
 from typing import Any, TypeAlias, Union
 
 import polars as pl
@@ -167,20 +168,29 @@ class AFTime:
     def __str__(self) -> str:
         return self.expression
 
+    def __eq__(self, other: object) -> bool:
+        # Compare expressions directly instead of building field tuples
+        if other.__class__ is self.__class__:
+            return self.expression == other.expression
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.expression)
+
     @classmethod
     def now(cls) -> AFTime:
         """Create an AFTime representing the current time."""
-        return cls("*")
+        return _AFTIME_NOW if cls is AFTime else cls("*")
 
     @classmethod
     def today(cls) -> AFTime:
         """Create an AFTime representing today at midnight."""
-        return cls("t")
+        return _AFTIME_TODAY if cls is AFTime else cls("t")
 
     @classmethod
     def yesterday(cls) -> AFTime:
         """Create an AFTime representing yesterday at midnight."""
-        return cls("y")
+        return _AFTIME_YESTERDAY if cls is AFTime else cls("y")
 
     @classmethod
     def ago(cls, **kwargs: int) -> AFTime:
@@ -195,18 +205,13 @@ class AFTime:
         Example:
             >>> AFTime.ago(days=1, hours=2)  # 1 day and 2 hours ago
         """
-        parts = []
-        if days := kwargs.get("days"):
-            parts.append(f"{days}d")
-        if hours := kwargs.get("hours"):
-            parts.append(f"{hours}h")
-        if minutes := kwargs.get("minutes"):
-            parts.append(f"{minutes}m")
-        if seconds := kwargs.get("seconds"):
-            parts.append(f"{seconds}s")
-
-        offset = "".join(parts) if parts else "0s"
-        return cls(f"*-{offset}")
+        time = _relative_time(
+            kwargs.get("days") or 0,
+            kwargs.get("hours") or 0,
+            kwargs.get("minutes") or 0,
+            kwargs.get("seconds") or 0,
+        )
+        return time if cls is AFTime else cls(time.expression)
 
     @classmethod
     def from_datetime(cls, dt: datetime) -> AFTime:
@@ -214,6 +219,34 @@ class AFTime:
         return cls(dt.isoformat())
 
 
+# AFTime is immutable, so the fixed relative times are shared instances
+_AFTIME_NOW = AFTime("*")
+_AFTIME_TODAY = AFTime("t")
+_AFTIME_YESTERDAY = AFTime("y")
+
+
+@lru_cache(maxsize=256, typed=True)
+def _relative_time(days: int, hours: int, minutes: int, seconds: int) -> AFTime:
+    """Build the AFTime for AFTime.ago, cached per offset and argument type.
+
+    ``days=1`` and ``days=1.0`` format differently ("1d" vs "1.0d"), so
+    they must not share a cache entry.
+    """
+    parts = ["*-"]
+    if days:
+        parts.append(f"{days}d")
+    if hours:
+        parts.append(f"{hours}h")
+    if minutes:
+        parts.append(f"{minutes}m")
+    if seconds:
+        parts.append(f"{seconds}s")
+    if len(parts) == 1:
+        parts.append("0s")
+
+    return AFTime("".join(parts))
+
+
 @dataclass(slots=True)
 class PIValue:
     """Represents a single PI value with timestamp and quality.
@@ -241,7 +274,7 @@ class PIValue:
         return {
             "timestamp": self.timestamp,
             "value": self.value,
-            "quality": self.quality.value,
+            "quality": int(self.quality),
         }
 
 
@@ -265,15 +298,34 @@ class TimeRange:
             >>> TimeRange.last(days=7)  # Last 7 days
             >>> TimeRange.last(hours=24)  # Last 24 hours
         """
-        return cls(
-            start=AFTime.ago(**kwargs),
-            end=AFTime.now(),
+        if cls is not TimeRange:
+            return cls(start=AFTime.ago(**kwargs), end=AFTime.now())
+        return _last_range(
+            kwargs.get("days") or 0,
+            kwargs.get("hours") or 0,
+            kwargs.get("minutes") or 0,
+            kwargs.get("seconds") or 0,
         )
 
     @classmethod
     def today(cls) -> TimeRange:
         """Create a time range for today."""
-        return cls(start=AFTime.today(), end=AFTime.now())
+        if cls is not TimeRange:
+            return cls(start=AFTime.today(), end=AFTime.now())
+        return _TODAY_RANGE
+
+
+# TimeRange is immutable, so relative ranges are shared instances
+_TODAY_RANGE = TimeRange(start=AFTime.today(), end=AFTime.now())
+
+
+@lru_cache(maxsize=64, typed=True)
+def _last_range(days: int, hours: int, minutes: int, seconds: int) -> TimeRange:
+    """Build the TimeRange for TimeRange.last, cached per offset and argument type."""
+    return TimeRange(
+        start=AFTime.ago(days=days, hours=hours, minutes=minutes, seconds=seconds),
+        end=AFTime.now(),
+    )
 
 
 @dataclass(frozen=True, slots=True)
@@ -357,6 +409,10 @@ class PointConfig:
     alias: str = ""
     """Point alias."""
 
+    def __hash__(self) -> int:
+        # Equal configs share a point ID, so it alone is a valid hash
+        return hash(self.point_id)
+
 
 @dataclass(frozen=True, slots=True)
 class SummaryResult:
@@ -153,11 +153,11 @@ class BulkExtractor:
         # Get all snapshots at once using bulk API
         af_values = point_list.CurrentValue()
 
-        result = {}
-        for i, tag in enumerate(tags):
-            result[tag] = self._convert_value(af_values[i])
-
-        return result
+        # Enumerate the results once rather than indexing into them
+        return {
+            tag: self._convert_value(af_value)
+            for tag, af_value in zip(tags, af_values, strict=True)
+        }
 
     def recorded_values(
         self,
@@ -205,9 +205,15 @@ class BulkExtractor:
         PIPointList = self._sdk.pi_point_list_class
         point_list = PIPointList()
 
+        # Tags that name the same point (PI Point names are case-insensitive)
+        # share one entry in the point list and receive the same values
+        tags_by_id: dict[int, list[str]] = {}
         for tag in tags:
             point = self._connection.get_point(tag)
-            point_list.Add(point)
+            point_id = int(point.ID)
+            if point_id not in tags_by_id:
+                point_list.Add(point)
+            tags_by_id.setdefault(point_id, []).append(tag)
 
         time_range = self._create_time_range(start, end)
         AFBoundaryType = self._sdk.get_type("OSIsoft.AF.Data", "AFBoundaryType")
@@ -229,19 +235,28 @@ class BulkExtractor:
             paging_config,
         )
 
-        result = {}
-        for i, tag in enumerate(tags):
+        # Enumerate the results once rather than indexing into them, matching
+        # each to its tags by point ID; tags without a result keep an empty list
+        result: dict[str, list[PIValue]] = {tag: [] for tag in tags}
+        for tag_values in bulk_results:
+            point = tag_values.PIPoint
+            point_tags = tags_by_id.get(int(point.ID))
+            if point_tags is None:
+                logger.warning(f"Ignoring bulk result for unrequested point {point.Name}")
+                continue
+
             values = []
             try:
-                for af_value in bulk_results[i]:
+                for af_value in tag_values:
                     values.append(self._convert_value(af_value))
             except Exception as e:
-                logger.warning(f"Error processing values for {tag}: {e}")
+                logger.warning(f"Error processing values for {point_tags[0]}: {e}")
 
             if max_count > 0:
                 values = values[:max_count]
 
-            result[tag] = values
+            for tag in point_tags:
+                result[tag] = list(values)
 
         return result
 
@@ -263,18 +278,27 @@ class BulkExtractor:
         Returns:
             Dictionary mapping tag names to lists of PIValues
         """
-        result = {}
+        # Tags keep their requested order regardless of completion order
+        result: dict[str, list[PIValue]] = {tag: [] for tag in tags}
         errors = {}
 
+        # Resolve uncached points in one server call so the workers hit the
+        # connection's point cache; missing tags are reported per tag below
+        try:
+            self._connection.cache_points(tags)
+        except Exception as e:
+            logger.debug(f"Bulk point lookup failed, resolving per tag: {e}")
+
+        time_range = self._create_time_range(start, end)
+        boundary = self._sdk.get_type("OSIsoft.AF.Data", "AFBoundaryType").Inside
+
         def fetch_tag(tag: str) -> BulkResult:
             try:
                 point = self._connection.get_point(tag)
-                time_range = self._create_time_range(start, end)
-                AFBoundaryType = self._sdk.get_type("OSIsoft.AF.Data", "AFBoundaryType")
 
                 af_values = point.RecordedValues(
                     time_range,
-                    AFBoundaryType.Inside,
+                    boundary,
                     None,
                     False,
                     max_count,
@@ -288,7 +312,8 @@ class BulkExtractor:
                     tag=tag, values=[], success=False, error=str(e)
                 )
 
-        with ThreadPoolExecutor(max_workers=self._max_parallel) as executor:
+        max_workers = min(self._max_parallel, len(tags))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {executor.submit(fetch_tag, tag): tag for tag in tags}
 
             for future in as_completed(futures):
@@ -296,7 +321,6 @@ class BulkExtractor:
                 if bulk_result.success:
                     result[bulk_result.tag] = bulk_result.values
                 else:
-                    result[bulk_result.tag] = []
                     errors[bulk_result.tag] = bulk_result.error
 
         if errors:
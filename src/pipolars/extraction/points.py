@@ -7,17 +7,24 @@ from PI Points (tags) in the PI Data Archive.
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import islice
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import polars as pl
 
 from pipolars.connection.sdk import get_sdk_manager
+from pipolars.core.exceptions import PIAFSDKError, PIQueryError
 from pipolars.core.types import (
     AFTime,
     BoundaryType,
     DataQuality,
-    PITimestamp,
     PIValue,
     PointConfig,
     PointType,
@@ -25,10 +32,182 @@ from pipolars.core.types import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
     from pipolars.connection.server import PIServerConnection
+    from pipolars.core.types import PITimestamp
 
 logger = logging.getLogger(__name__)
 
+# PI point type names as reported by the "pointtype" attribute
+_POINT_TYPE_MAP: dict[str, PointType] = {
+    "Float16": PointType.FLOAT16,
+    "Float32": PointType.FLOAT32,
+    "Float64": PointType.FLOAT64,
+    "Int16": PointType.INT16,
+    "Int32": PointType.INT32,
+    "Digital": PointType.DIGITAL,
+    "Timestamp": PointType.TIMESTAMP,
+    "String": PointType.STRING,
+    "Blob": PointType.BLOB,
+}
+
+# SDK types resolved up front when PIPOLARS_WARM_SDK=1
+_WARM_SDK_TYPES = (
+    ("OSIsoft.AF.Time", "AFTime"),
+    ("OSIsoft.AF.Time", "AFTimeRange"),
+    ("OSIsoft.AF.Time", "AFTimeSpan"),
+    ("OSIsoft.AF.Data", "AFBoundaryType"),
+    ("OSIsoft.AF.Data", "AFSummaryTypes"),
+    ("OSIsoft.AF.Data", "AFCalculationBasis"),
+    ("OSIsoft.AF.Data", "AFTimestampCalculation"),
+    ("OSIsoft.AF.Data", "AFRetrievalMode"),
+    ("OSIsoft.AF.PI", "PIPagingConfiguration"),
+)
+
+# PI point attributes read by PIPointExtractor.get_point_config
+_POINT_CONFIG_ATTRIBUTES = (
+    # Core attributes
+    "pointid",
+    "pointtype",
+    "descriptor",
+    "engunits",
+    "zero",
+    "span",
+    "displaydigits",
+    "typicalvalue",
+    # Alarm thresholds
+    "valuehighalarm",
+    "valuelowalarm",
+    "valuehighwarning",
+    "valuelowwarning",
+    # Rate of change limits
+    "rocinghighvalue",
+    "rocinglowvalue",
+    # Interface information
+    "interfaceid",
+    "interfacename",
+    # Scan and source information
+    "scantime",
+    "srcptid",
+    "srcptname",
+    # Additional metadata
+    "convers",
+    "devname",
+    "alias",
+)
+
+# Result column names keyed by AFSummaryTypes flag value
+_SUMMARY_NAME_MAP: dict[int, str] = {
+    1: "total",
+    2: "average",
+    4: "minimum",
+    8: "maximum",
+    16: "range",
+    32: "std_dev",
+    64: "pop_std_dev",
+    128: "count",
+    8192: "percent_good",
+}
+
+# .NET DateTime.Ticks are 100 ns intervals since 0001-01-01 00:00:00
+_NET_EPOCH = datetime(1, 1, 1)
+_TICKS_PER_MILLISECOND = 10_000
+
+# Value converter per AFValue.Value type, filled on first sight of each type
+_VALUE_CONVERTERS: dict[type, Callable[[Any], Any]] = {}
+
+
+def _digital_state_name(value: Any) -> str:
+    """Convert a digital state to its name."""
+    return str(value.Name)
+
+
+def _net_object_value(value: Any) -> float | str:
+    """Convert a .NET object to a float, or to its string form."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return str(value.ToString())
+
+
+def _unchanged_value(value: Any) -> Any:
+    """Return a value that pythonnet already converted."""
+    return value
+
+
+def _select_value_converter(value: Any) -> Callable[[Any], Any]:
+    """Choose the converter for values of the same type as ``value``."""
+    if hasattr(value, "Name"):
+        return _digital_state_name
+    if hasattr(value, "ToString"):
+        return _net_object_value
+    return _unchanged_value
+
+
+def _summary_value(value: Any) -> Any:
+    """Unwrap a summary AFValue.Value, as a float where possible."""
+    if hasattr(value, "Value"):
+        value = value.Value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+# Pages buffered ahead of the consumer by _prefetch_pages
+_PREFETCH_DEPTH = 2
+_PAGES_DONE = object()
+
+
+def _prefetch_pages(values: Iterable[Any], page_size: int) -> Iterator[list[Any]]:
+    """Read an SDK enumerable in pages on a background thread.
+
+    The next page is fetched from the server while the caller processes the
+    current one; pythonnet releases the GIL during the .NET call so the two
+    genuinely overlap. At most ``_PREFETCH_DEPTH`` pages are held in memory.
+
+    Args:
+        values: Enumerable returned by the SDK (e.g. paged RecordedValues)
+        page_size: Number of values per page
+
+    Yields:
+        Lists of up to ``page_size`` raw SDK values
+    """
+    pages: queue.Queue[Any] = queue.Queue(maxsize=_PREFETCH_DEPTH)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            iterator = iter(values)
+            while page := list(islice(iterator, page_size)):
+                if not put(page):
+                    return
+        except BaseException as e:
+            put(e)
+        else:
+            put(_PAGES_DONE)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipolars-prefetch") as executor:
+        executor.submit(produce)
+        try:
+            while (item := pages.get()) is not _PAGES_DONE:
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Unblock the producer if the caller stopped iterating early
+            stop.set()
+
 
 @dataclass
 class RecordedValuesOptions:
@@ -74,6 +253,9 @@ class PIPointExtractor:
         ...     print(f"{v.timestamp}: {v.value}")
     """
 
+    # Whether the SDK types in _WARM_SDK_TYPES were resolved in this process
+    _sdk_warmed: ClassVar[bool] = False
+
     def __init__(self, connection: PIServerConnection) -> None:
         """Initialize the extractor.
 
@@ -83,6 +265,105 @@ class PIPointExtractor:
         self._connection = connection
         self._sdk = get_sdk_manager()
 
+        if not PIPointExtractor._sdk_warmed and os.environ.get("PIPOLARS_WARM_SDK") == "1":
+            self._warm_sdk_types()
+
+    def _warm_sdk_types(self) -> None:
+        """Resolve the SDK types used by queries ahead of the first query.
+
+        The first lookup of each type loads its assembly and namespace, which
+        is slow; later lookups are served from pythonnet's module cache. This
+        runs once per process, and only when PIPOLARS_WARM_SDK=1, so scripts
+        that favour fast startup keep lazy resolution.
+        """
+        PIPointExtractor._sdk_warmed = True
+        for namespace, type_name in _WARM_SDK_TYPES:
+            try:
+                self._sdk.get_type(namespace, type_name)
+            except PIAFSDKError as e:
+                logger.debug(f"Could not pre-resolve {namespace}.{type_name}: {e}")
+
+    def clear_point_cache(self) -> None:
+        """Forget the PIPoint handles cached by the connection.
+
+        PIPoint lookups are memoized per connection, so repeated calls for
+        the same tag resolve it only once. Call this after points are
+        renamed or recreated on the server.
+        """
+        self._connection.clear_point_cache()
+
+    # SDK types are resolved by name through pythonnet; each is looked up on
+    # first use and then kept on the extractor.
+
+    @cached_property
+    def _af_time(self) -> Any:
+        """The AFTime class."""
+        return self._sdk.af_time_class
+
+    @cached_property
+    def _af_time_range(self) -> Any:
+        """The AFTimeRange class."""
+        return self._sdk.af_time_range_class
+
+    @cached_property
+    def _af_boundary_type(self) -> Any:
+        """The AFBoundaryType enum."""
+        return self._sdk.get_type("OSIsoft.AF.Data", "AFBoundaryType")
+
+    @cached_property
+    def _af_summary_types(self) -> Any:
+        """The AFSummaryTypes flags enum."""
+        return self._sdk.get_type("OSIsoft.AF.Data", "AFSummaryTypes")
+
+    @cached_property
+    def _af_calculation_basis(self) -> Any:
+        """The AFCalculationBasis enum."""
+        return self._sdk.get_type("OSIsoft.AF.Data", "AFCalculationBasis")
+
+    @cached_property
+    def _af_timestamp_calculation(self) -> Any:
+        """The AFTimestampCalculation enum."""
+        return self._sdk.get_type("OSIsoft.AF.Data", "AFTimestampCalculation")
+
+    @cached_property
+    def _af_retrieval_mode(self) -> Any:
+        """The AFRetrievalMode enum."""
+        return self._sdk.get_type("OSIsoft.AF.Data", "AFRetrievalMode")
+
+    @cached_property
+    def _af_time_span(self) -> Any:
+        """The AFTimeSpan class."""
+        return self._sdk.get_type("OSIsoft.AF.Time", "AFTimeSpan")
+
+    @cached_property
+    def _pi_paging_configuration(self) -> Any:
+        """The PIPagingConfiguration class."""
+        return self._sdk.get_type("OSIsoft.AF.PI", "PIPagingConfiguration")
+
+    @cached_property
+    def _point_config_attributes(self) -> Any:
+        """.NET List[String] of the attributes read by get_point_config.
+
+        Built once so each call passes the same list instead of marshalling
+        a Python list.
+        """
+        List = self._sdk.get_type("System.Collections.Generic", "List")
+        String = self._sdk.get_type("System", "String")
+        attributes = List[String]()
+        for name in _POINT_CONFIG_ATTRIBUTES:
+            attributes.Add(name)
+        return attributes
+
+    @cached_property
+    def _boundary_map(self) -> dict[BoundaryType, Any]:
+        """Mapping of BoundaryType to the SDK AFBoundaryType values."""
+        AFBoundaryType = self._af_boundary_type
+        return {
+            BoundaryType.INSIDE: AFBoundaryType.Inside,
+            BoundaryType.OUTSIDE: AFBoundaryType.Outside,
+            BoundaryType.INTERPOLATED: AFBoundaryType.Interpolated,
+        }
+
     def _parse_time(self, time: PITimestamp) -> Any:
         """Convert a timestamp to AFTime.
 
@@ -92,8 +373,11 @@ class PIPointExtractor:
         Returns:
             AFTime object
         """
-        AFTime_class = self._sdk.af_time_class
+        AFTime_class = self._af_time
 
+        # PI time expressions such as "*-1d" are the common case
+        if type(time) is str:
+            return AFTime_class(time)
         if isinstance(time, datetime):
             return AFTime_class(time.isoformat())
         elif isinstance(time, AFTime):
@@ -115,29 +399,59 @@ class PIPointExtractor:
         Returns:
             AFTimeRange object
         """
-        AFTimeRange = self._sdk.af_time_range_class
+        AFTimeRange = self._af_time_range
         start_time = self._parse_time(start)
         end_time = self._parse_time(end)
         return AFTimeRange(start_time, end_time)
 
-    def _convert_net_datetime(self, net_datetime: Any) -> datetime:
+    @staticmethod
+    def _convert_net_datetime(net_datetime: Any) -> datetime:
         """Convert a .NET DateTime to Python datetime.
 
         Args:
             net_datetime: .NET DateTime object
 
         Returns:
-            Python datetime object
+            Python datetime object, truncated to milliseconds
         """
-        return datetime(
-            net_datetime.Year,
-            net_datetime.Month,
-            net_datetime.Day,
-            net_datetime.Hour,
-            net_datetime.Minute,
-            net_datetime.Second,
-            net_datetime.Millisecond * 1000,  # Convert ms to us
-        )
+        # One Ticks read instead of seven component reads across the CLR
+        return _NET_EPOCH + timedelta(milliseconds=net_datetime.Ticks // _TICKS_PER_MILLISECOND)
+
+    @staticmethod
+    def _convert_raw_value(value: Any) -> Any:
+        """Convert the Value of an AFValue to a Python value.
+
+        The conversion is chosen once per value type and cached, so repeated
+        values of the same type skip the attribute probing.
+
+        Args:
+            value: The raw value from PI SDK
+
+        Returns:
+            Digital state name, float, or string
+        """
+        value_type = type(value)
+        converter = _VALUE_CONVERTERS.get(value_type)
+        if converter is None:
+            converter = _select_value_converter(value)
+            _VALUE_CONVERTERS[value_type] = converter
+        return converter(value)
+
+    @staticmethod
+    def _get_quality(af_value: Any) -> DataQuality:
+        """Get the quality flag of an AFValue.
+
+        Args:
+            af_value: The AFValue from PI SDK
+
+        Returns:
+            DataQuality of the value
+        """
+        if af_value.IsGood is False:
+            return DataQuality.BAD
+        if hasattr(af_value, "Substituted") and af_value.Substituted:
+            return DataQuality.SUBSTITUTED
+        return DataQuality.GOOD
 
     def _convert_value(self, af_value: Any) -> PIValue:
         """Convert an AFValue to PIValue.
@@ -148,35 +462,56 @@ class PIPointExtractor:
         Returns:
             PIValue object
         """
-        # Get timestamp and convert from .NET DateTime to Python datetime
-        net_timestamp = af_value.Timestamp.LocalTime
-        timestamp = self._convert_net_datetime(net_timestamp)
-
-        # Get value - handle digital states and errors
-        value = af_value.Value
-        if hasattr(value, "Name"):
-            # Digital state
-            value = str(value.Name)
-        elif hasattr(value, "ToString"):
-            # Try to get numeric value
-            try:
-                value = float(value)
-            except (ValueError, TypeError):
-                value = str(value.ToString())
-
-        # Get quality
-        quality = DataQuality.GOOD
-        if af_value.IsGood is False:
-            quality = DataQuality.BAD
-        elif hasattr(af_value, "Substituted") and af_value.Substituted:
-            quality = DataQuality.SUBSTITUTED
-
         return PIValue(
-            timestamp=timestamp,
-            value=value,
-            quality=quality,
+            timestamp=self._convert_net_datetime(af_value.Timestamp.LocalTime),
+            value=self._convert_raw_value(af_value.Value),
+            quality=self._get_quality(af_value),
         )
 
+    def _value_columns(
+        self,
+        af_values: Any,
+    ) -> tuple[list[datetime], list[Any], list[DataQuality]]:
+        """Split AFValues into timestamp, value and quality columns.
+
+        The collection is walked once with the converters bound to locals,
+        which avoids per-value attribute lookups on the extractor.
+
+        Args:
+            af_values: AFValues collection (or any iterable of AFValue)
+
+        Returns:
+            Tuple of (timestamps, values, qualities) lists of equal length
+        """
+        timestamps: list[datetime] = []
+        values: list[Any] = []
+        qualities: list[DataQuality] = []
+
+        convert_datetime = self._convert_net_datetime
+        convert_raw_value = self._convert_raw_value
+        get_quality = self._get_quality
+        add_timestamp = timestamps.append
+        add_value = values.append
+        add_quality = qualities.append
+
+        for af_value in af_values:
+            add_timestamp(convert_datetime(af_value.Timestamp.LocalTime))
+            add_value(convert_raw_value(af_value.Value))
+            add_quality(get_quality(af_value))
+
+        return timestamps, values, qualities
+
+    def _convert_values(self, af_values: Any) -> list[PIValue]:
+        """Convert an AFValues collection to a list of PIValues.
+
+        Args:
+            af_values: AFValues collection (or any iterable of AFValue)
+
+        Returns:
+            List of PIValue objects in collection order
+        """
+        return list(map(PIValue, *self._value_columns(af_values)))
+
     def _get_attr(self, attrs: Any, key: str, default: Any = None) -> Any:
         """Safely get a value from a .NET IDictionary.
 
@@ -207,52 +542,11 @@ class PIPointExtractor:
         point = self._connection.get_point(tag_name)
 
         # Get point attributes - including additional attributes
-        attrs = point.GetAttributes([
-            # Core attributes
-            "pointid",
-            "pointtype",
-            "descriptor",
-            "engunits",
-            "zero",
-            "span",
-            "displaydigits",
-            "typicalvalue",
-            # Alarm thresholds
-            "valuehighalarm",
-            "valuelowalarm",
-            "valuehighwarning",
-            "valuelowwarning",
-            # Rate of change limits
-            "rocinghighvalue",
-            "rocinglowvalue",
-            # Interface information
-            "interfaceid",
-            "interfacename",
-            # Scan and source information
-            "scantime",
-            "srcptid",
-            "srcptname",
-            # Additional metadata
-            "convers",
-            "devname",
-            "alias",
-        ])
+        attrs = point.GetAttributes(self._point_config_attributes)
 
         # Map point type
-        point_type_map = {
-            "Float16": PointType.FLOAT16,
-            "Float32": PointType.FLOAT32,
-            "Float64": PointType.FLOAT64,
-            "Int16": PointType.INT16,
-            "Int32": PointType.INT32,
-            "Digital": PointType.DIGITAL,
-            "Timestamp": PointType.TIMESTAMP,
-            "String": PointType.STRING,
-            "Blob": PointType.BLOB,
-        }
-
         point_type_str = str(self._get_attr(attrs, "pointtype", "Float32"))
-        point_type = point_type_map.get(point_type_str, PointType.FLOAT64)
+        point_type = _POINT_TYPE_MAP.get(point_type_str, PointType.FLOAT64)
 
         # Helper to safely convert to float
         def safe_float(val: Any) -> float | None:
@@ -325,21 +619,20 @@ class PIPointExtractor:
         Returns:
             Dictionary mapping tag names to PIValues
         """
+        if not tag_names:
+            return {}
+
         PIPointList = self._sdk.pi_point_list_class
         point_list = PIPointList()
 
-        for tag_name in tag_names:
-            point = self._connection.get_point(tag_name)
+        # Resolve all points in one bulk lookup
+        for point in self._connection.get_points(tag_names):
             point_list.Add(point)
 
         # Get all snapshots at once
         af_values = point_list.CurrentValue()
 
-        result = {}
-        for i, tag_name in enumerate(tag_names):
-            result[tag_name] = self._convert_value(af_values[i])
-
-        return result
+        return dict(zip(tag_names, self._convert_values(af_values), strict=True))
 
     def recorded_values(
         self,
@@ -359,18 +652,45 @@ class PIPointExtractor:
         Returns:
             List of PIValue objects
         """
+        return list(map(PIValue, *self.recorded_values_columns(tag_name, start, end, options)))
+
+    def recorded_values_columns(
+        self,
+        tag_name: str,
+        start: PITimestamp,
+        end: PITimestamp,
+        options: RecordedValuesOptions | None = None,
+    ) -> tuple[list[datetime], list[Any], list[DataQuality]]:
+        """Get recorded values for a PI Point as columns.
+
+        Unlike :meth:`recorded_values`, no PIValue is created per sample;
+        the columns can be passed straight to
+        ``PIToPolarsConverter.columns_to_dataframe``.
+
+        Args:
+            tag_name: The PI Point name
+            start: Start time
+            end: End time
+            options: Optional retrieval options
+
+        Returns:
+            Tuple of (timestamps, values, qualities) lists
+
+        Raises:
+            PIQueryError: If options.max_count is negative
+        """
         options = options or RecordedValuesOptions()
+        if options.max_count < 0:
+            raise PIQueryError(
+                f"max_count must be >= 0, got {options.max_count}",
+                query=tag_name,
+            )
+
         point = self._connection.get_point(tag_name)
         time_range = self._create_time_range(start, end)
 
         # Get boundary type enum
-        AFBoundaryType = self._sdk.get_type("OSIsoft.AF.Data", "AFBoundaryType")
-        boundary_map = {
-            BoundaryType.INSIDE: AFBoundaryType.Inside,
-            BoundaryType.OUTSIDE: AFBoundaryType.Outside,
-            BoundaryType.INTERPOLATED: AFBoundaryType.Interpolated,
-        }
-        boundary = boundary_map.get(options.boundary_type, AFBoundaryType.Inside)
+        boundary = self._boundary_map.get(options.boundary_type, self._af_boundary_type.Inside)
 
         # Call RecordedValues
         af_values = point.RecordedValues(
@@ -381,7 +701,7 @@ class PIPointExtractor:
             options.max_count,
         )
 
-        return [self._convert_value(v) for v in af_values]
+        return self._value_columns(af_values)
 
     def recorded_values_iterator(
         self,
@@ -392,6 +712,9 @@ class PIPointExtractor:
     ) -> Iterator[PIValue]:
         """Iterate over recorded values with pagination.
 
+        The next page is prefetched in the background while the current
+        page is being consumed.
+
         Args:
             tag_name: The PI Point name
             start: Start time
@@ -404,10 +727,7 @@ class PIPointExtractor:
         point = self._connection.get_point(tag_name)
         time_range = self._create_time_range(start, end)
 
-        AFBoundaryType = self._sdk.get_type("OSIsoft.AF.Data", "AFBoundaryType")
-        PIPagingConfiguration = self._sdk.get_type(
-            "OSIsoft.AF.PI", "PIPagingConfiguration"
-        )
+        PIPagingConfiguration = self._pi_paging_configuration
 
         # Configure paging
         paging_config = PIPagingConfiguration(
@@ -418,14 +738,14 @@ class PIPointExtractor:
         # Get paginated results
         af_values = point.RecordedValues(
             time_range,
-            AFBoundaryType.Inside,
+            self._af_boundary_type.Inside,
             None,  # filter expression
             False,  # include filtered
             paging_config,
         )
 
-        for af_value in af_values:
-            yield self._convert_value(af_value)
+        for page in _prefetch_pages(af_values, page_size):
+            yield from self._convert_values(page)
 
     def interpolated_values(
         self,
@@ -452,8 +772,7 @@ class PIPointExtractor:
         time_range = self._create_time_range(start, end)
 
         # Parse interval
-        AFTimeSpan = self._sdk.get_type("OSIsoft.AF.Time", "AFTimeSpan")
-        time_interval = AFTimeSpan.Parse(interval)
+        time_interval = self._af_time_span.Parse(interval)
 
         # Call InterpolatedValues
         af_values = point.InterpolatedValues(
@@ -463,7 +782,7 @@ class PIPointExtractor:
             options.include_filtered_values,
         )
 
-        return [self._convert_value(v) for v in af_values]
+        return self._convert_values(af_values)
 
     def plot_values(
         self,
@@ -491,7 +810,7 @@ class PIPointExtractor:
 
         af_values = point.PlotValues(time_range, intervals)
 
-        return [self._convert_value(v) for v in af_values]
+        return self._convert_values(af_values)
 
     def summary(
         self,
@@ -515,57 +834,33 @@ class PIPointExtractor:
         time_range = self._create_time_range(start, end)
 
         # Convert summary types to SDK enum
-        AFSummaryTypes = self._sdk.get_type("OSIsoft.AF.Data", "AFSummaryTypes")
+        AFSummaryTypes = self._af_summary_types
 
         if isinstance(summary_types, list):
-            # Start with first type, then OR the rest
-            sdk_summary = AFSummaryTypes(summary_types[0].value)
-            for st in summary_types[1:]:
-                sdk_summary |= AFSummaryTypes(st.value)
+            # OR the flag values in Python, then build the SDK enum once
+            combined = 0
+            for st in summary_types:
+                combined |= st.value
+            sdk_summary = AFSummaryTypes(combined)
         else:
             sdk_summary = AFSummaryTypes(summary_types.value)
 
         # Get summary
-        AFCalculationBasis = self._sdk.get_type("OSIsoft.AF.Data", "AFCalculationBasis")
-        AFTimestampCalculation = self._sdk.get_type(
-            "OSIsoft.AF.Data", "AFTimestampCalculation"
-        )
-
         summaries = point.Summary(
             time_range,
             sdk_summary,
-            AFCalculationBasis.TimeWeighted,
-            AFTimestampCalculation.Auto,
+            self._af_calculation_basis.TimeWeighted,
+            self._af_timestamp_calculation.Auto,
         )
 
         # Convert to dictionary
         # PI SDK returns IDictionary<AFSummaryTypes, AFValue>
         result = {}
-        summary_name_map = {
-            1: "total",
-            2: "average",
-            4: "minimum",
-            8: "maximum",
-            16: "range",
-            32: "std_dev",
-            64: "pop_std_dev",
-            128: "count",
-            8192: "percent_good",
-        }
 
         # Iterate over dictionary keys
         for key in summaries.Keys:
-            summary_type_value = int(key)
-            name = summary_name_map.get(summary_type_value, str(summary_type_value))
-            af_value = summaries[key]
-            # Extract the actual value
-            value = af_value.Value
-            if hasattr(value, "Value"):
-                value = value.Value
-            try:
-                result[name] = float(value)
-            except (ValueError, TypeError):
-                result[name] = value
+            name = self._get_summary_name(int(key))
+            result[name] = _summary_value(summaries[key].Value)
 
         return result
 
@@ -589,23 +884,85 @@ class PIPointExtractor:
         Returns:
             List of dictionaries with summary values per interval
         """
-        point = self._connection.get_point(tag_name)
-        time_range = self._create_time_range(start, end)
+        timestamps, columns = self.summaries_columns(tag_name, start, end, interval, summary_types)
+        names = list(columns)
+        values = list(columns.values())
+
+        results = []
+        for i, timestamp in enumerate(timestamps):
+            row: dict[str, Any] = {"timestamp": timestamp}
+            for name, column in zip(names, values, strict=True):
+                row[name] = column[i]
+            results.append(row)
+
+        return results
+
+    def summaries_df(
+        self,
+        tag_name: str,
+        start: PITimestamp,
+        end: PITimestamp,
+        interval: str,
+        summary_types: SummaryType | list[SummaryType] = SummaryType.AVERAGE,
+    ) -> pl.DataFrame:
+        """Get summary values over multiple intervals as a DataFrame.
+
+        Builds the frame directly from columns rather than via per-interval
+        dictionaries.
 
-        AFSummaryTypes = self._sdk.get_type("OSIsoft.AF.Data", "AFSummaryTypes")
-        AFTimeSpan = self._sdk.get_type("OSIsoft.AF.Time", "AFTimeSpan")
-        AFCalculationBasis = self._sdk.get_type("OSIsoft.AF.Data", "AFCalculationBasis")
-        AFTimestampCalculation = self._sdk.get_type(
-            "OSIsoft.AF.Data", "AFTimestampCalculation"
+        Args:
+            tag_name: The PI Point name
+            start: Start time
+            end: End time
+            interval: Time interval for each summary
+            summary_types: Summary type(s) to calculate
+
+        Returns:
+            DataFrame with a timestamp column and one column per summary type
+        """
+        timestamps, columns = self.summaries_columns(tag_name, start, end, interval, summary_types)
+        return pl.DataFrame(
+            {"timestamp": pl.Series(timestamps, dtype=pl.Datetime("us")), **columns},
+            strict=False,
         )
 
-        time_interval = AFTimeSpan.Parse(interval)
+    def summaries_columns(
+        self,
+        tag_name: str,
+        start: PITimestamp,
+        end: PITimestamp,
+        interval: str,
+        summary_types: SummaryType | list[SummaryType] = SummaryType.AVERAGE,
+    ) -> tuple[list[datetime], dict[str, list[Any]]]:
+        """Get summary values over multiple intervals as columns.
+
+        Args:
+            tag_name: The PI Point name
+            start: Start time
+            end: End time
+            interval: Time interval for each summary
+            summary_types: Summary type(s) to calculate
+
+        Returns:
+            Tuple of (sorted timestamps, column values keyed by summary name)
+        """
+        point = self._connection.get_point(tag_name)
+
+        # An empty range has no intervals
+        if start == end:
+            return [], {}
+
+        time_range = self._create_time_range(start, end)
+
+        AFSummaryTypes = self._af_summary_types
+        time_interval = self._af_time_span.Parse(interval)
 
         if isinstance(summary_types, list):
-            # Start with first type, then OR the rest
-            sdk_summary = AFSummaryTypes(summary_types[0].value)
-            for st in summary_types[1:]:
-                sdk_summary |= AFSummaryTypes(st.value)
+            # OR the flag values in Python, then build the SDK enum once
+            combined = 0
+            for st in summary_types:
+                combined |= st.value
+            sdk_summary = AFSummaryTypes(combined)
         else:
             sdk_summary = AFSummaryTypes(summary_types.value)
 
@@ -613,59 +970,63 @@ class PIPointExtractor:
             time_range,
             time_interval,
             sdk_summary,
-            AFCalculationBasis.TimeWeighted,
-            AFTimestampCalculation.Auto,
+            self._af_calculation_basis.TimeWeighted,
+            self._af_timestamp_calculation.Auto,
         )
 
-        # Convert to list of dictionaries
-        # PI SDK returns IDictionary<AFSummaryTypes, AFValues>
-        # AFValues is a collection of timestamped values
-        # We need to pivot this into a list of {timestamp, summary1, summary2, ...}
+        return self._summary_columns(summaries)
 
-        # First, collect all data by timestamp
-        timestamp_data: dict[datetime, dict[str, Any]] = {}
+    def _summary_columns(
+        self,
+        summaries: Any,
+    ) -> tuple[list[datetime], dict[str, list[Any]]]:
+        """Pivot an SDK Summaries result into a timestamp list and value columns.
 
-        for summary_type_key in summaries.Keys:
-            summary_type_value = int(summary_type_key)
-            name = self._get_summary_name(summary_type_value)
-            af_values = summaries[summary_type_key]
-
-            # AFValues is iterable
-            for af_value in af_values:
-                net_timestamp = af_value.Timestamp.LocalTime
-                py_timestamp = self._convert_net_datetime(net_timestamp)
-
-                if py_timestamp not in timestamp_data:
-                    timestamp_data[py_timestamp] = {"timestamp": py_timestamp}
-
-                value = af_value.Value
-                if hasattr(value, "Value"):
-                    value = value.Value
-                try:
-                    timestamp_data[py_timestamp][name] = float(value)
-                except (ValueError, TypeError):
-                    timestamp_data[py_timestamp][name] = value
-
-        # Convert to sorted list
-        results = list(timestamp_data.values())
-        results.sort(key=lambda x: x["timestamp"])
+        The SDK returns IDictionary<AFSummaryTypes, AFValues>, one AFValues per
+        requested summary type. The column name is resolved once per summary
+        type. When every type reports the same interval timestamps (the usual
+        case) the columns are aligned by position; otherwise rows are merged
+        by timestamp and missing entries are None.
 
-        return results
+        Args:
+            summaries: Result of PIPoint.Summaries
 
-    def _get_summary_name(self, summary_type_value: int) -> str:
+        Returns:
+            Tuple of (sorted timestamps, column values keyed by summary name)
+        """
+        convert_datetime = self._convert_net_datetime
+        series: list[tuple[str, list[datetime], list[Any]]] = []
+
+        for summary_type_key in summaries.Keys:
+            name = self._get_summary_name(int(summary_type_key))
+            af_values = list(summaries[summary_type_key])
+            series.append(
+                (
+                    name,
+                    [convert_datetime(v.Timestamp.LocalTime) for v in af_values],
+                    [_summary_value(v.Value) for v in af_values],
+                )
+            )
+
+        if not series:
+            return [], {}
+
+        timestamps = series[0][1]
+        if all(ts == timestamps for _, ts, _ in series[1:]) and timestamps == sorted(timestamps):
+            return timestamps, {name: values for name, _, values in series}
+
+        # Timestamps differ between summary types; merge rows by timestamp
+        timestamps = sorted(set().union(*(ts for _, ts, _ in series)))
+        columns = {}
+        for name, ts, values in series:
+            by_time = dict(zip(ts, values, strict=True))
+            columns[name] = [by_time.get(t) for t in timestamps]
+        return timestamps, columns
+
+    @staticmethod
+    def _get_summary_name(summary_type_value: int) -> str:
         """Get the name for a summary type value."""
-        summary_name_map = {
-            1: "total",
-            2: "average",
-            4: "minimum",
-            8: "maximum",
-            16: "range",
-            32: "std_dev",
-            64: "pop_std_dev",
-            128: "count",
-            8192: "percent_good",
-        }
-        return summary_name_map.get(summary_type_value, str(summary_type_value))
+        return _SUMMARY_NAME_MAP.get(summary_type_value, str(summary_type_value))
 
     def value_at(self, tag_name: str, time: PITimestamp) -> PIValue:
         """Get the value at a specific time.
@@ -680,7 +1041,6 @@ class PIPointExtractor:
         point = self._connection.get_point(tag_name)
         af_time = self._parse_time(time)
 
-        AFRetrievalMode = self._sdk.get_type("OSIsoft.AF.Data", "AFRetrievalMode")
-        af_value = point.RecordedValue(af_time, AFRetrievalMode.AtOrBefore)
+        af_value = point.RecordedValue(af_time, self._af_retrieval_mode.AtOrBefore)
 
         return self._convert_value(af_value)
@@ -14,6 +14,7 @@ import polars as pl
 
 from pipolars.core.config import PolarsConfig
 from pipolars.core.types import (
+    DataQuality,
     PIValue,
 )
 
@@ -58,7 +59,35 @@ class PIToPolarsConverter:
         Returns:
             Polars DataFrame with timestamp and value columns
         """
-        if not values:
+        return self.columns_to_dataframe(
+            [pv.timestamp for pv in values],
+            [pv.value for pv in values],
+            [pv.quality for pv in values],
+            include_quality,
+        )
+
+    def columns_to_dataframe(
+        self,
+        timestamps: Sequence[datetime],
+        values: Sequence[Any],
+        qualities: Sequence[DataQuality],
+        include_quality: bool | None = None,
+    ) -> pl.DataFrame:
+        """Convert timestamp, value and quality columns to a Polars DataFrame.
+
+        This is the column-oriented form of :meth:`values_to_dataframe`; it
+        lets extractors skip building a PIValue per sample.
+
+        Args:
+            timestamps: Timestamp of each sample
+            values: Value of each sample
+            qualities: Quality of each sample
+            include_quality: Include quality column (default from config)
+
+        Returns:
+            Polars DataFrame with timestamp and value columns
+        """
+        if not timestamps:
             # Return empty DataFrame with schema
             return pl.DataFrame(
                 schema={
@@ -71,58 +100,30 @@ class PIToPolarsConverter:
             include_quality if include_quality is not None else self._config.include_quality
         )
 
-        # Build column lists for efficient DataFrame construction
-        timestamps: list[datetime] = []
-        qualities: list[int] | None = [] if include_quality else None
-
-        # First pass: determine if we have digital (string) values
+        # Determine if we have digital (string) values
         has_string_values = False
-        for pv in values:
-            if isinstance(pv.value, str):
+        for value in values:
+            if isinstance(value, str):
                 # Check if it's a numeric string or a digital state string
                 try:
-                    float(pv.value)
+                    float(value)
                 except (ValueError, TypeError):
                     has_string_values = True
                     break
 
-        # Second pass: build the values list with appropriate type
+        # Build the values column with the appropriate type
+        data_values: list[Any]
         if has_string_values:
-            # Use string type for digital states
-            data_values: list[str | None] = []
-            for pv in values:
-                timestamps.append(pv.timestamp)
-
-                if pv.value is None:
-                    data_values.append(None)
-                elif isinstance(pv.value, str):
-                    data_values.append(pv.value)
-                else:
-                    # Convert numeric to string for consistency
-                    data_values.append(str(pv.value))
-
-                if qualities is not None:
-                    qualities.append(pv.quality.value)
+            # Use string type for digital states; numerics are converted to
+            # string for consistency
+            data_values = [
+                value if value is None or isinstance(value, str) else str(value) for value in values
+            ]
         else:
             # Use float type for numeric values
-            numeric_values: list[float | None] = []
-            for pv in values:
-                timestamps.append(pv.timestamp)
-
-                if isinstance(pv.value, (int, float)):
-                    numeric_values.append(float(pv.value))
-                elif isinstance(pv.value, str):
-                    try:
-                        numeric_values.append(float(pv.value))
-                    except (ValueError, TypeError):
-                        numeric_values.append(None)
-                else:
-                    numeric_values.append(None)
-
-                if qualities is not None:
-                    qualities.append(pv.quality.value)
-
-            data_values = numeric_values  # type: ignore[assignment]
+            data_values = [
+                float(value) if isinstance(value, (int, float, str)) else None for value in values
+            ]
 
         # Build DataFrame
         data: dict[str, Any] = {
@@ -130,8 +131,9 @@ class PIToPolarsConverter:
             self._config.value_column: data_values,
         }
 
-        if qualities is not None:
-            data[self._config.quality_column] = qualities
+        if include_quality:
+            # DataQuality is an IntEnum, so int() avoids the Enum.value descriptor
+            data[self._config.quality_column] = list(map(int, qualities))
 
         df = pl.DataFrame(data)
 
@@ -207,7 +209,7 @@ class PIToPolarsConverter:
                         all_values.append(str(pv.value))
 
                     if all_qualities is not None:
-                        all_qualities.append(pv.quality.value)
+                        all_qualities.append(int(pv.quality))
         else:
             # Use float type for numeric values
             numeric_values: list[float | None] = []
@@ -227,7 +229,7 @@ class PIToPolarsConverter:
                         numeric_values.append(None)
 
                     if all_qualities is not None:
-                        all_qualities.append(pv.quality.value)
+                        all_qualities.append(int(pv.quality))
 
             all_values = numeric_values  # type: ignore[assignment]
 
@@ -333,6 +335,38 @@ class PIToPolarsConverter:
 
         return df
 
+    def tag_summaries_frame(
+        self,
+        tag_name: str,
+        summaries: pl.DataFrame,
+    ) -> pl.DataFrame:
+        """Label a single tag's time-series summaries DataFrame.
+
+        Produces the same layout as time_series_summaries_to_dataframe for
+        one tag, starting from a frame with a timestamp column and one
+        column per summary type.
+
+        Args:
+            tag_name: The PI Point name
+            summaries: Interval summaries for the tag
+
+        Returns:
+            Polars DataFrame with time-series summary data
+        """
+        df = summaries.select(
+            pl.lit(tag_name, dtype=pl.Utf8).alias(self._config.tag_column),
+            pl.all(),
+        )
+
+        if self._config.timestamp_column in df.columns:
+            df = df.with_columns(
+                pl.col(self._config.timestamp_column)
+                .cast(pl.Datetime("us"))
+                .dt.replace_time_zone(self._config.timezone)
+            )
+
+        return df
+
     def values_to_series(
         self,
         values: Sequence[PIValue],
@@ -0,0 +1,147 @@
+"""Unit tests for BulkExtractor."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pipolars.connection.server import PIServerConnection
+from pipolars.core.exceptions import PIPointNotFoundError
+from pipolars.extraction.bulk import BulkExtractor
+
+
+@pytest.fixture
+def extractor() -> BulkExtractor:
+    """Create a bulk extractor over a mocked connection and SDK."""
+    extractor = BulkExtractor(MagicMock())
+    extractor._sdk = MagicMock()
+    return extractor
+
+
+class TestParallelRecordedValues:
+    """Tests for concurrent multi-tag recorded values."""
+
+    def test_points_resolved_in_bulk(self, extractor: BulkExtractor) -> None:
+        """Test that all points are looked up with one call before fanning out."""
+        conn = extractor._connection
+        conn.get_point.return_value.RecordedValues.return_value = []
+
+        extractor.recorded_values(["TAG1", "TAG2", "TAG3"], "*-1d", "*")
+
+        conn.cache_points.assert_called_once_with(["TAG1", "TAG2", "TAG3"])
+        extractor._sdk.af_time_range_class.assert_called_once()
+
+    def test_results_keep_tag_order(self, extractor: BulkExtractor) -> None:
+        """Test that results follow the requested order and failures are empty."""
+        tags = [f"TAG{i}" for i in range(8)]
+
+        def get_point(tag: str) -> Any:
+            if tag == "TAG3":
+                raise PIPointNotFoundError(tag)
+            return MagicMock()
+
+        extractor._connection.get_point.side_effect = get_point
+
+        result = extractor.recorded_values(tags, "*-1d", "*")
+
+        assert list(result) == tags
+        assert result["TAG3"] == []
+
+
+class FakeNetList(list[Any]):
+    """Stand-in for the .NET List[String] type."""
+
+    def __class_getitem__(cls, item: Any) -> Any:
+        return cls
+
+    def Add(self, item: Any) -> None:
+        self.append(item)
+
+
+class TestCachePoints:
+    """Tests for resolving points through the connection's point cache."""
+
+    @pytest.fixture
+    def connection(self) -> PIServerConnection:
+        """Create a connected PIServerConnection over a mocked SDK."""
+        with patch("pipolars.connection.server.get_sdk_manager"):
+            connection = PIServerConnection("my-pi-server")
+        connection._sdk.get_type.side_effect = lambda _ns, name: (
+            FakeNetList if name == "List" else str
+        )
+        connection._server = MagicMock()
+        connection._connected = True
+        return connection
+
+    def test_cached_points_skip_server(self, connection: PIServerConnection) -> None:
+        """Test that no FindPIPoints call is made when every point is cached."""
+        connection._point_cache = {"TAG1": MagicMock(), "TAG2": MagicMock()}
+        find = connection._sdk.pi_point_class.FindPIPoints
+
+        assert connection.cache_points(["TAG1", "TAG2"]) == []
+        find.assert_not_called()
+
+    def test_only_uncached_points_looked_up(self, connection: PIServerConnection) -> None:
+        """Test that only uncached names are sent to FindPIPoints."""
+        connection._point_cache = {"TAG1": MagicMock()}
+        point = MagicMock()
+        point.Name = "tag2"
+        find = connection._sdk.pi_point_class.FindPIPoints
+        find.return_value = [point]
+
+        assert connection.cache_points(["TAG1", "TAG2", "TAG3"]) == ["TAG3"]
+        find.assert_called_once_with(connection._server, ["TAG2", "TAG3"], None)
+        assert type(find.call_args.args[1]) is FakeNetList
+        assert connection._point_cache["TAG2"] is point
+
+
+class FakeAFValues(list):
+    """Stand-in for the AFValues of one point in a bulk result."""
+
+    def __init__(self, point: Any, values: list[Any]) -> None:
+        super().__init__(values)
+        self.PIPoint = point
+
+
+def fake_point(name: str, point_id: int) -> Any:
+    """Create a stand-in PIPoint."""
+    point = MagicMock()
+    point.Name = name
+    point.ID = point_id
+    return point
+
+
+class TestBulkRecordedValues:
+    """Tests for PIPointList-based multi-tag recorded values."""
+
+    def test_results_matched_by_point_id(self, extractor: BulkExtractor) -> None:
+        """Test that results are keyed by point, not by position."""
+        points = {tag: fake_point(tag, i) for i, tag in enumerate(["TAG1", "TAG2", "TAG3"])}
+        extractor._connection.get_point.side_effect = points.__getitem__
+        extractor._sdk.pi_point_list_class.return_value.RecordedValues.return_value = [
+            FakeAFValues(points["TAG2"], [2.0]),
+            FakeAFValues(fake_point("EXTRA", 9), [9.0]),
+            FakeAFValues(points["TAG1"], [1.0, 1.5]),
+        ]
+
+        with patch.object(extractor, "_convert_value", side_effect=lambda v: v):
+            result = extractor.recorded_values(
+                ["TAG1", "TAG2", "TAG3"], "*-1d", "*", parallel=False
+            )
+
+        assert result == {"TAG1": [1.0, 1.5], "TAG2": [2.0], "TAG3": []}
+
+    def test_case_variants_share_one_point(self, extractor: BulkExtractor) -> None:
+        """Test that tags differing only in case both get the point's values."""
+        point = fake_point("Tag1", 1)
+        extractor._connection.get_point.return_value = point
+        point_list = extractor._sdk.pi_point_list_class.return_value
+        point_list.RecordedValues.return_value = [FakeAFValues(point, [1.0])]
+
+        with patch.object(extractor, "_convert_value", side_effect=lambda v: v):
+            result = extractor.recorded_values(["TAG1", "tag1"], "*-1d", "*", parallel=False)
+
+        point_list.Add.assert_called_once_with(point)
+        assert result == {"TAG1": [1.0], "tag1": [1.0]}
@@ -1,73 +1,184 @@
 """Unit tests for PIClient."""
 
+import time
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from pipolars.api.client import PIClient
-from pipolars.core.config import PIConfig, PIServerConfig
+from pipolars.core.config import CacheBackend, CacheConfig, PIConfig, PIServerConfig
+from pipolars.core.types import DataQuality
+
+
+@pytest.fixture(autouse=True)
+def mock_connection() -> Iterator[MagicMock]:
+    """Patch PIServerConnection so no test touches the PI SDK."""
+    with patch("pipolars.api.client.PIServerConnection") as mock:
+        yield mock
 
 
 class TestPIClientInitialization:
     """Tests for PIClient initialization."""
 
-    @patch("pipolars.api.client.PIServerConnection")
-    def test_blank_server_uses_default(self, mock_connection: MagicMock) -> None:
+    def test_blank_server_uses_default(self) -> None:
         """Test that blank server name uses default localhost."""
         client = PIClient("")
 
         assert client.config.server.host == "localhost"
 
-    @patch("pipolars.api.client.PIServerConnection")
-    def test_whitespace_server_uses_default(self, mock_connection: MagicMock) -> None:
+    def test_whitespace_server_uses_default(self) -> None:
         """Test that whitespace-only server name uses default localhost."""
         client = PIClient("   ")
 
         assert client.config.server.host == "localhost"
 
-    @patch("pipolars.api.client.PIServerConnection")
-    def test_none_server_uses_default(self, mock_connection: MagicMock) -> None:
+    def test_none_server_uses_default(self) -> None:
         """Test that None server uses default localhost."""
         client = PIClient(None)
 
         assert client.config.server.host == "localhost"
 
-    @patch("pipolars.api.client.PIServerConnection")
-    def test_no_args_uses_default(self, mock_connection: MagicMock) -> None:
+    def test_no_args_uses_default(self) -> None:
         """Test that no arguments uses default localhost."""
         client = PIClient()
 
         assert client.config.server.host == "localhost"
 
-    @patch("pipolars.api.client.PIServerConnection")
-    def test_explicit_server_name(self, mock_connection: MagicMock) -> None:
+    def test_explicit_server_name(self) -> None:
         """Test that explicit server name is used."""
         client = PIClient("my-pi-server")
 
         assert client.config.server.host == "my-pi-server"
 
-    @patch("pipolars.api.client.PIServerConnection")
-    def test_server_config_object(self, mock_connection: MagicMock) -> None:
+    def test_server_config_object(self) -> None:
         """Test that PIServerConfig object is used."""
         server_config = PIServerConfig(host="config-server")
         client = PIClient(server_config)
 
         assert client.config.server.host == "config-server"
 
-    @patch("pipolars.api.client.PIServerConnection")
-    def test_full_config_object(self, mock_connection: MagicMock) -> None:
+    def test_full_config_object(self) -> None:
         """Test that full PIConfig object is used."""
         config = PIConfig(server=PIServerConfig(host="full-config-server"))
         client = PIClient(config=config)
 
         assert client.config.server.host == "full-config-server"
 
-    @patch("pipolars.api.client.PIServerConnection")
-    def test_config_takes_precedence_over_server(
-        self, mock_connection: MagicMock
-    ) -> None:
+    def test_config_takes_precedence_over_server(self) -> None:
         """Test that config parameter takes precedence over server."""
         config = PIConfig(server=PIServerConfig(host="config-host"))
         client = PIClient(server="server-arg", config=config)
 
         assert client.config.server.host == "config-host"
+
+
+class TestPIClientTagLookup:
+    """Tests for PIClient tag lookup helpers."""
+
+    def test_tags_exist_uses_single_lookup(self, mock_connection: MagicMock) -> None:
+        """Test that tags_exist resolves all tags in one connection call."""
+        conn = mock_connection.return_value
+        conn.points_exist.return_value = {"SINUSOID": True, "MISSING": False}
+        client = PIClient("my-pi-server")
+
+        result = client.tags_exist(["SINUSOID", "MISSING"])
+
+        assert result == {"SINUSOID": True, "MISSING": False}
+        conn.points_exist.assert_called_once_with(["SINUSOID", "MISSING"])
+        conn.point_exists.assert_not_called()
+
+
+class TestPIClientRecordedCache:
+    """Tests for serving recorded values from cached ranges."""
+
+    def test_subrange_is_sliced_from_cached_range(self) -> None:
+        """Test that a range inside a cached range does not hit the server."""
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        timestamps = [base + timedelta(minutes=10 * i) for i in range(13)]
+        config = PIConfig(
+            server=PIServerConfig(host="my-pi-server"),
+            cache=CacheConfig(backend=CacheBackend.MEMORY),
+        )
+        client = PIClient(config=config)
+        extractor = MagicMock()
+        extractor.recorded_values_columns.return_value = (
+            timestamps,
+            [float(i) for i in range(13)],
+            [DataQuality.GOOD] * 13,
+        )
+        client._point_extractor = extractor
+
+        wide = client.recorded_values("SINUSOID", base, base + timedelta(hours=2))
+        narrow = client.recorded_values(
+            "SINUSOID", base + timedelta(hours=1), base + timedelta(hours=2)
+        )
+
+        assert extractor.recorded_values_columns.call_count == 1
+        assert len(wide) == 13
+        assert narrow["value"].to_list() == [float(i) for i in range(6, 13)]
+
+    def test_naive_subrange_on_non_utc_host(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that naive bounds select local wall-clock rows off UTC."""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            base = datetime(2024, 1, 1)
+            timestamps = [base + timedelta(hours=i) for i in range(24)]
+            config = PIConfig(
+                server=PIServerConfig(host="my-pi-server"),
+                cache=CacheConfig(backend=CacheBackend.MEMORY),
+            )
+            client = PIClient(config=config)
+            extractor = MagicMock()
+            extractor.recorded_values_columns.return_value = (
+                timestamps,
+                [float(i) for i in range(24)],
+                [DataQuality.GOOD] * 24,
+            )
+            client._point_extractor = extractor
+
+            client.recorded_values("SINUSOID", base, base + timedelta(hours=23))
+            narrow = client.recorded_values(
+                "SINUSOID", base + timedelta(hours=10), base + timedelta(hours=12)
+            )
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert extractor.recorded_values_columns.call_count == 1
+        assert narrow["value"].to_list() == [10.0, 11.0, 12.0]
+
+    def test_open_ranges_are_not_cached(self) -> None:
+        """Test that a range reaching the current time always queries the server."""
+        end = datetime.now(timezone.utc) + timedelta(minutes=5)
+        config = PIConfig(
+            server=PIServerConfig(host="my-pi-server"),
+            cache=CacheConfig(backend=CacheBackend.MEMORY),
+        )
+        client = PIClient(config=config)
+        extractor = MagicMock()
+        extractor.recorded_values_columns.return_value = ([], [], [])
+        client._point_extractor = extractor
+
+        client.recorded_values("SINUSOID", end - timedelta(hours=2), end)
+        client.recorded_values("SINUSOID", end - timedelta(hours=1), end)
+
+        assert extractor.recorded_values_columns.call_count == 2
+
+    def test_relative_times_are_not_cached(self) -> None:
+        """Test that relative time expressions always query the server."""
+        config = PIConfig(
+            server=PIServerConfig(host="my-pi-server"),
+            cache=CacheConfig(backend=CacheBackend.MEMORY),
+        )
+        client = PIClient(config=config)
+        extractor = MagicMock()
+        extractor.recorded_values_columns.return_value = ([], [], [])
+        client._point_extractor = extractor
+
+        client.recorded_values("SINUSOID", "*-2h", "*")
+        client.recorded_values("SINUSOID", "*-1h", "*")
+
+        assert extractor.recorded_values_columns.call_count == 2
@@ -54,6 +54,7 @@ class TestPIToPolarsConverter:
         df = converter.values_to_dataframe(sample_values, include_quality=True)
 
         assert "quality" in df.columns
+        assert df["quality"].dtype == pl.Int64
 
     def test_values_to_dataframe_empty(
         self,
@@ -67,6 +68,21 @@ class TestPIToPolarsConverter:
         assert "timestamp" in df.columns
         assert "value" in df.columns
 
+    def test_columns_to_dataframe_matches_values(
+        self,
+        converter: PIToPolarsConverter,
+        sample_values: list[PIValue],
+    ) -> None:
+        """Test that column input gives the same frame as PIValue input."""
+        df = converter.columns_to_dataframe(
+            [pv.timestamp for pv in sample_values],
+            [pv.value for pv in sample_values],
+            [pv.quality for pv in sample_values],
+            include_quality=True,
+        )
+
+        assert df.equals(converter.values_to_dataframe(sample_values, include_quality=True))
+
     def test_multi_tag_to_dataframe(
         self,
         converter: PIToPolarsConverter,
@@ -117,6 +133,22 @@ class TestPIToPolarsConverter:
         assert "tag" in df.columns
         assert "average" in df.columns
 
+    def test_tag_summaries_frame_matches_time_series(
+        self,
+        converter: PIToPolarsConverter,
+    ) -> None:
+        """Test that a labelled summary frame matches the row-based conversion."""
+        base_time = datetime(2024, 1, 1, 0, 0, 0)
+        timestamps = [base_time + timedelta(hours=i) for i in range(3)]
+        intervals = [
+            {"timestamp": ts, "average": float(i), "maximum": float(i * 2)}
+            for i, ts in enumerate(timestamps)
+        ]
+
+        df = converter.tag_summaries_frame("TAG1", pl.DataFrame(intervals))
+
+        assert df.equals(converter.time_series_summaries_to_dataframe({"TAG1": intervals}))
+
     def test_values_to_series(
         self,
         converter: PIToPolarsConverter,
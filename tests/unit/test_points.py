@@ -0,0 +1,371 @@
+"""Unit tests for PIPointExtractor value conversion."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pipolars.core.exceptions import PIPointNotFoundError, PIQueryError
+from pipolars.core.types import BoundaryType, DataQuality, PIValue, SummaryType
+from pipolars.extraction.points import PIPointExtractor, RecordedValuesOptions
+
+
+class FakeNetDateTime:
+    """Stand-in for a .NET DateTime."""
+
+    def __init__(self, dt: datetime) -> None:
+        self.Year = dt.year
+        self.Month = dt.month
+        self.Day = dt.day
+        self.Hour = dt.hour
+        self.Minute = dt.minute
+        self.Second = dt.second
+        self.Millisecond = dt.microsecond // 1000
+        self.Ticks = (dt - datetime(1, 1, 1)) // timedelta(microseconds=1) * 10
+
+
+class FakeDigitalState:
+    """Stand-in for an AFEnumerationValue."""
+
+    def __init__(self, name: str) -> None:
+        self.Name = name
+
+
+class FakeNetString(str):
+    """Stand-in for a .NET string value."""
+
+    def ToString(self) -> str:
+        return str(self)
+
+
+class FakeAFValue:
+    """Stand-in for an AFValue."""
+
+    def __init__(
+        self,
+        dt: datetime,
+        value: Any,
+        is_good: bool = True,
+        substituted: bool = False,
+    ) -> None:
+        self.Timestamp = MagicMock()
+        self.Timestamp.LocalTime = FakeNetDateTime(dt)
+        self.Value = value
+        self.IsGood = is_good
+        self.Substituted = substituted
+
+
+class FakeSummaries(dict[int, list[FakeAFValue]]):
+    """Stand-in for the IDictionary returned by PIPoint.Summaries."""
+
+    @property
+    def Keys(self) -> list[int]:
+        return list(self)
+
+
+@pytest.fixture
+def extractor() -> PIPointExtractor:
+    """Create an extractor over a mocked connection and SDK."""
+    extractor = PIPointExtractor(MagicMock())
+    extractor._sdk = MagicMock()
+    return extractor
+
+
+@pytest.fixture
+def af_values() -> list[FakeAFValue]:
+    """Create AFValues covering numeric, digital, string and bad values."""
+    base_time = datetime(2024, 1, 1, 0, 0, 0, 250000)
+    return [
+        FakeAFValue(base_time, 1.5),
+        FakeAFValue(base_time + timedelta(hours=1), FakeDigitalState("Shutdown")),
+        FakeAFValue(base_time + timedelta(hours=2), FakeNetString("text")),
+        FakeAFValue(base_time + timedelta(hours=3), FakeNetString("2.5"), substituted=True),
+        FakeAFValue(base_time + timedelta(hours=4), None, is_good=False),
+    ]
+
+
+class TestValueConversion:
+    """Tests for AFValue to PIValue conversion."""
+
+    def test_convert_values_matches_single_conversion(
+        self,
+        extractor: PIPointExtractor,
+        af_values: list[FakeAFValue],
+    ) -> None:
+        """Test that batch conversion matches converting values one by one."""
+        expected = [extractor._convert_value(v) for v in af_values]
+
+        assert extractor._convert_values(af_values) == expected
+
+    def test_convert_values_fields(
+        self,
+        extractor: PIPointExtractor,
+        af_values: list[FakeAFValue],
+    ) -> None:
+        """Test converted timestamps, values and qualities."""
+        result = extractor._convert_values(af_values)
+
+        assert result[0] == PIValue(
+            timestamp=datetime(2024, 1, 1, 0, 0, 0, 250000),
+            value=1.5,
+            quality=DataQuality.GOOD,
+        )
+        assert [pv.value for pv in result] == [1.5, "Shutdown", "text", 2.5, None]
+        assert [pv.quality for pv in result] == [
+            DataQuality.GOOD,
+            DataQuality.GOOD,
+            DataQuality.GOOD,
+            DataQuality.SUBSTITUTED,
+            DataQuality.BAD,
+        ]
+
+    def test_recorded_values(
+        self,
+        extractor: PIPointExtractor,
+        af_values: list[FakeAFValue],
+    ) -> None:
+        """Test that recorded_values converts the SDK result."""
+        point = extractor._connection.get_point.return_value
+        point.RecordedValues.return_value = af_values
+
+        result = extractor.recorded_values("SINUSOID", "*-1d", "*")
+
+        assert len(result) == len(af_values)
+        assert result[1].value == "Shutdown"
+
+    def test_snapshots_resolves_points_in_bulk(
+        self,
+        extractor: PIPointExtractor,
+        af_values: list[FakeAFValue],
+    ) -> None:
+        """Test that snapshots looks up all points with one connection call."""
+        tag_names = ["TAG1", "TAG2"]
+        conn = extractor._connection
+        conn.get_points.return_value = ["point1", "point2"]
+        point_list = extractor._sdk.pi_point_list_class.return_value
+        point_list.CurrentValue.return_value = af_values[:2]
+
+        result = extractor.snapshots(tag_names)
+
+        conn.get_points.assert_called_once_with(tag_names)
+        conn.get_point.assert_not_called()
+        assert list(result) == tag_names
+        assert result["TAG2"].value == "Shutdown"
+
+    def test_recorded_values_boundary_type(self, extractor: PIPointExtractor) -> None:
+        """Test that boundary types map to the SDK enum through the cached map."""
+        af_boundary_type = MagicMock()
+        extractor._af_boundary_type = af_boundary_type
+        point = extractor._connection.get_point.return_value
+        point.RecordedValues.return_value = []
+
+        for boundary_type in BoundaryType:
+            extractor.recorded_values(
+                "SINUSOID", "*-1d", "*", RecordedValuesOptions(boundary_type=boundary_type)
+            )
+
+        boundaries = [c.args[1] for c in point.RecordedValues.call_args_list]
+        assert boundaries == [
+            af_boundary_type.Inside,
+            af_boundary_type.Outside,
+            af_boundary_type.Interpolated,
+        ]
+        assert extractor._boundary_map is extractor._boundary_map
+
+    def test_snapshots_empty(self, extractor: PIPointExtractor) -> None:
+        """Test that no tags means no SDK calls."""
+        assert extractor.snapshots([]) == {}
+        extractor._connection.get_points.assert_not_called()
+
+    def test_recorded_values_negative_max_count(self, extractor: PIPointExtractor) -> None:
+        """Test that an invalid max_count is rejected before calling the SDK."""
+        with pytest.raises(PIQueryError):
+            extractor.recorded_values("SINUSOID", "*-1d", "*", RecordedValuesOptions(max_count=-1))
+        extractor._connection.get_point.assert_not_called()
+
+    def test_recorded_values_iterator_pages(
+        self,
+        extractor: PIPointExtractor,
+        af_values: list[FakeAFValue],
+    ) -> None:
+        """Test that prefetched pages are yielded in order."""
+        point = extractor._connection.get_point.return_value
+        point.RecordedValues.return_value = iter(af_values)
+
+        result = list(extractor.recorded_values_iterator("SINUSOID", "*-1d", "*", page_size=2))
+
+        assert result == extractor._convert_values(af_values)
+
+    def test_recorded_values_iterator_early_exit(
+        self,
+        extractor: PIPointExtractor,
+        af_values: list[FakeAFValue],
+    ) -> None:
+        """Test that stopping iteration early does not hang the prefetch thread."""
+        point = extractor._connection.get_point.return_value
+        point.RecordedValues.return_value = af_values * 10
+
+        iterator = extractor.recorded_values_iterator("SINUSOID", "*-1d", "*", page_size=1)
+        first = next(iterator)
+        iterator.close()
+
+        assert first.value == 1.5
+
+    def test_summary_types_combined_once(self, extractor: PIPointExtractor) -> None:
+        """Test that summary types are OR-ed before building the SDK enum."""
+        af_summary_types = MagicMock()
+        extractor._af_summary_types = af_summary_types
+        point = extractor._connection.get_point.return_value
+        point.Summary.return_value.Keys = []
+
+        extractor.summary(
+            "SINUSOID", "*-1d", "*", [SummaryType.AVERAGE, SummaryType.MINIMUM, SummaryType.MAXIMUM]
+        )
+
+        af_summary_types.assert_called_once_with(
+            SummaryType.AVERAGE.value | SummaryType.MINIMUM.value | SummaryType.MAXIMUM.value
+        )
+
+    def test_clear_point_cache(self, extractor: PIPointExtractor) -> None:
+        """Test that clearing the point cache clears the connection's cache."""
+        extractor.clear_point_cache()
+
+        extractor._connection.clear_point_cache.assert_called_once_with()
+
+
+class TestSummaries:
+    """Tests for pivoting interval summaries."""
+
+    def test_summaries_aligned(self, extractor: PIPointExtractor) -> None:
+        """Test summary types sharing interval timestamps form one row each."""
+        base_time = datetime(2024, 1, 1)
+        times = [base_time + timedelta(hours=i) for i in range(3)]
+        point = extractor._connection.get_point.return_value
+        point.Summaries.return_value = FakeSummaries(
+            {
+                2: [FakeAFValue(t, float(i)) for i, t in enumerate(times)],
+                8: [FakeAFValue(t, FakeNetString(str(i * 10))) for i, t in enumerate(times)],
+            }
+        )
+
+        result = extractor.summaries("SINUSOID", "*-3h", "*", "1h")
+
+        assert result == [
+            {"timestamp": t, "average": float(i), "maximum": float(i * 10)}
+            for i, t in enumerate(times)
+        ]
+
+    def test_summaries_merged_by_timestamp(self, extractor: PIPointExtractor) -> None:
+        """Test summary types with differing timestamps are merged by time."""
+        base_time = datetime(2024, 1, 1)
+        later = base_time + timedelta(minutes=30)
+        point = extractor._connection.get_point.return_value
+        point.Summaries.return_value = FakeSummaries(
+            {
+                2: [FakeAFValue(base_time, 1.0)],
+                4: [FakeAFValue(later, 0.5)],
+            }
+        )
+
+        result = extractor.summaries("SINUSOID", "*-1h", "*", "1h")
+
+        assert result == [
+            {"timestamp": base_time, "average": 1.0, "minimum": None},
+            {"timestamp": later, "average": None, "minimum": 0.5},
+        ]
+
+    def test_summary_values(self, extractor: PIPointExtractor) -> None:
+        """Test that single summaries are unwrapped like per-interval ones."""
+        base_time = datetime(2024, 1, 1)
+        point = extractor._connection.get_point.return_value
+        point.Summary.return_value = FakeSummaries(
+            {
+                2: FakeAFValue(base_time, 1.5),  # type: ignore[dict-item]
+                128: FakeAFValue(base_time, FakeAFValue(base_time, "3")),  # type: ignore[dict-item]
+            }
+        )
+
+        assert extractor.summary("SINUSOID", "*-1d", "*") == {"average": 1.5, "count": 3.0}
+
+    def test_summaries_df(self, extractor: PIPointExtractor) -> None:
+        """Test that the DataFrame matches the per-interval dictionaries."""
+        base_time = datetime(2024, 1, 1)
+        times = [base_time + timedelta(hours=i) for i in range(3)]
+        point = extractor._connection.get_point.return_value
+        point.Summaries.return_value = FakeSummaries(
+            {
+                2: [FakeAFValue(t, float(i)) for i, t in enumerate(times)],
+                4: [FakeAFValue(t, float(-i)) for i, t in enumerate(times)],
+            }
+        )
+
+        df = extractor.summaries_df("SINUSOID", "*-3h", "*", "1h")
+
+        assert df.columns == ["timestamp", "average", "minimum"]
+        assert df.to_dicts() == extractor.summaries("SINUSOID", "*-3h", "*", "1h")
+
+    def test_summaries_empty_range(self, extractor: PIPointExtractor) -> None:
+        """Test that an empty time range returns no intervals without a query."""
+        point = extractor._connection.get_point.return_value
+
+        assert extractor.summaries("SINUSOID", "*", "*", "1h") == []
+        assert extractor.summaries_df("SINUSOID", "*", "*", "1h").is_empty()
+        point.Summaries.assert_not_called()
+
+    def test_summaries_empty_range_missing_point(self, extractor: PIPointExtractor) -> None:
+        """Test that an empty time range still reports a nonexistent point."""
+        extractor._connection.get_point.side_effect = PIPointNotFoundError("MISSING")
+
+        with pytest.raises(PIPointNotFoundError):
+            extractor.summaries("MISSING", "*", "*", "1h")
+
+
+class TestPointConfig:
+    """Tests for reading point configuration."""
+
+    def test_attribute_list_built_once(self, extractor: PIPointExtractor) -> None:
+        """Test that every call passes the same prebuilt .NET attribute list."""
+        point = extractor._connection.get_point.return_value
+        point.GetAttributes.return_value.ContainsKey.return_value = False
+
+        extractor.get_point_config("SINUSOID")
+        extractor.get_point_config("SINUSOID")
+
+        first, second = (c.args[0] for c in point.GetAttributes.call_args_list)
+        assert first is second
+        assert first is extractor._point_config_attributes
+
+
+class TestSDKWarmup:
+    """Tests for resolving SDK types ahead of the first query."""
+
+    @pytest.fixture(autouse=True)
+    def reset_warmed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Start each test as if no extractor had been created yet."""
+        monkeypatch.setattr(PIPointExtractor, "_sdk_warmed", False)
+
+    def test_warm_once_when_enabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that types are resolved once per process when enabled."""
+        monkeypatch.setenv("PIPOLARS_WARM_SDK", "1")
+        sdk = MagicMock()
+
+        with patch("pipolars.extraction.points.get_sdk_manager", return_value=sdk):
+            PIPointExtractor(MagicMock())
+            calls = sdk.get_type.call_count
+            PIPointExtractor(MagicMock())
+
+        assert calls > 0
+        assert sdk.get_type.call_count == calls
+
+    def test_lazy_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that no types are resolved unless warmup is enabled."""
+        monkeypatch.delenv("PIPOLARS_WARM_SDK", raising=False)
+        sdk = MagicMock()
+
+        with patch("pipolars.extraction.points.get_sdk_manager", return_value=sdk):
+            PIPointExtractor(MagicMock())
+
+        sdk.get_type.assert_not_called()
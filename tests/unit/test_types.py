@@ -1,6 +1,8 @@
 """Tests for PIPolars type definitions."""
 
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime
+from typing import Any
 
 import pytest
 
@@ -17,6 +19,18 @@ from pipolars.core.types import (
 )
 
 
+@pytest.fixture(scope="module")
+def fixed_timestamp() -> datetime:
+    """A fixed timestamp shared by the tests in this module."""
+    return datetime(2024, 1, 15, 10, 30, 0)
+
+
+@pytest.fixture(scope="module")
+def base_config() -> PointConfig:
+    """A PointConfig with only the required fields set."""
+    return PointConfig(name="TEST", point_id=1, point_type=PointType.FLOAT64)
+
+
 class TestAFTime:
     """Tests for AFTime class."""
 
@@ -35,6 +49,12 @@ class TestAFTime:
         time = AFTime.yesterday()
         assert time.expression == "y"
 
+    def test_fixed_times_are_shared(self) -> None:
+        """Test that now/today/yesterday return shared immutable instances."""
+        assert AFTime.now() is AFTime.now()
+        assert AFTime.today() is AFTime.today()
+        assert AFTime.yesterday() is AFTime.yesterday()
+
     def test_ago_days(self) -> None:
         """Test AFTime.ago() with days."""
         time = AFTime.ago(days=7)
@@ -51,12 +71,34 @@ class TestAFTime:
         assert "1d" in time.expression
         assert "2h" in time.expression
 
-    def test_from_datetime(self) -> None:
+    def test_ago_all_units(self) -> None:
+        """Test AFTime.ago() expression with every unit."""
+        time = AFTime.ago(days=1, hours=2, minutes=3, seconds=4)
+        assert time.expression == "*-1d2h3m4s"
+
+    def test_ago_is_cached(self) -> None:
+        """Test that repeated offsets return the same instance."""
+        assert AFTime.ago(days=7) is AFTime.ago(days=7)
+        assert AFTime.ago().expression == "*-0s"
+
+    def test_ago_cache_keeps_argument_types(self) -> None:
+        """Test that int and float offsets are cached apart."""
+        assert AFTime.ago(days=3).expression == "*-3d"
+        assert AFTime.ago(days=3.0).expression == "*-3.0d"  # type: ignore[arg-type]
+        assert AFTime.ago(days=3).expression == "*-3d"
+
+    def test_from_datetime(self, fixed_timestamp: datetime) -> None:
         """Test AFTime.from_datetime()."""
-        dt = datetime(2024, 1, 15, 10, 30, 0)
-        time = AFTime.from_datetime(dt)
+        time = AFTime.from_datetime(fixed_timestamp)
         assert "2024-01-15" in time.expression
 
+    def test_equality(self) -> None:
+        """Test AFTime equality and hashing by expression."""
+        assert AFTime("*-1d") == AFTime("*-1d")
+        assert AFTime("*-1d") != AFTime("*")
+        assert AFTime("*") != "*"
+        assert len({AFTime("*-1d"), AFTime("*-1d")}) == 1
+
     def test_str_representation(self) -> None:
         """Test string representation."""
         time = AFTime("*-1d")
@@ -66,35 +108,59 @@ class TestAFTime:
 class TestPIValue:
     """Tests for PIValue class."""
 
-    def test_creation(self) -> None:
+    def test_creation(self, fixed_timestamp: datetime) -> None:
         """Test PIValue creation."""
-        timestamp = datetime.now()
-        value = PIValue(timestamp=timestamp, value=50.0)
+        value = PIValue(timestamp=fixed_timestamp, value=50.0)
 
-        assert value.timestamp == timestamp
+        assert value.timestamp == fixed_timestamp
         assert value.value == 50.0
         assert value.quality == DataQuality.GOOD
         assert value.is_good is True
 
-    def test_bad_quality(self) -> None:
+    def test_bad_quality(self, fixed_timestamp: datetime) -> None:
         """Test PIValue with bad quality."""
         value = PIValue(
-            timestamp=datetime.now(),
+            timestamp=fixed_timestamp,
             value=0.0,
             quality=DataQuality.BAD,
         )
 
         assert value.is_good is False
 
-    def test_to_dict(self) -> None:
+    def test_plain_int_quality(self, fixed_timestamp: datetime) -> None:
+        """Test that a plain integer quality compares like the enum member."""
+        value = PIValue(timestamp=fixed_timestamp, value=1.0, quality=0)  # type: ignore[arg-type]
+
+        assert value.is_good is True
+
+    def test_to_dict(self, fixed_timestamp: datetime) -> None:
         """Test PIValue to_dict conversion."""
-        timestamp = datetime.now()
-        value = PIValue(timestamp=timestamp, value=100.0)
+        value = PIValue(timestamp=fixed_timestamp, value=100.0)
 
         d = value.to_dict()
-        assert d["timestamp"] == timestamp
+        assert d["timestamp"] == fixed_timestamp
         assert d["value"] == 100.0
         assert d["quality"] == DataQuality.GOOD.value
+        assert type(d["quality"]) is int
+
+
+class TestDataclassLayout:
+    """Tests for the memory layout of the value types."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            AFTime("*"),
+            PIValue(timestamp=datetime(2024, 1, 1), value=1.0),
+            TimeRange(start="*-1d", end="*"),
+            PointConfig(name="TEST", point_id=1, point_type=PointType.FLOAT64),
+            AnalysisInfo(name="Test", id="id", path="/path"),
+        ],
+        ids=lambda instance: type(instance).__name__,
+    )
+    def test_dataclasses_use_slots(self, instance: object) -> None:
+        """Test that the value types carry no per-instance __dict__."""
+        assert not hasattr(instance, "__dict__")
 
 
 class TestTimeRange:
@@ -103,20 +169,31 @@ class TestTimeRange:
     def test_last_days(self) -> None:
         """Test TimeRange.last() with days."""
         tr = TimeRange.last(days=7)
-        assert isinstance(tr.start, AFTime)
-        assert isinstance(tr.end, AFTime)
+        assert type(tr.start) is AFTime
+        assert type(tr.end) is AFTime
 
     def test_last_hours(self) -> None:
         """Test TimeRange.last() with hours."""
         tr = TimeRange.last(hours=24)
-        assert isinstance(tr.start, AFTime)
+        assert type(tr.start) is AFTime
 
     def test_today(self) -> None:
         """Test TimeRange.today()."""
         tr = TimeRange.today()
-        assert isinstance(tr.start, AFTime)
+        assert type(tr.start) is AFTime
         assert tr.start.expression == "t"
 
+    def test_relative_ranges_are_shared(self) -> None:
+        """Test that repeated relative ranges return the same instance."""
+        assert TimeRange.today() is TimeRange.today()
+        assert TimeRange.last(days=7) is TimeRange.last(days=7)
+        assert TimeRange.last(days=7).start == AFTime.ago(days=7)
+
+    def test_last_cache_keeps_argument_types(self) -> None:
+        """Test that int and float offsets are cached apart."""
+        assert TimeRange.last(hours=5).start == AFTime("*-5h")
+        assert TimeRange.last(hours=5.0).start == AFTime("*-5.0h")  # type: ignore[arg-type]
+
 
 class TestPointConfig:
     """Tests for PointConfig class."""
@@ -135,6 +212,14 @@ class TestPointConfig:
         assert config.point_id == 12345
         assert config.point_type == PointType.FLOAT64
 
+    def test_hash_by_point_id(self) -> None:
+        """Test that configs hash by point ID and work as dict keys."""
+        config = PointConfig(name="SINUSOID", point_id=12345, point_type=PointType.FLOAT64)
+        same = PointConfig(name="SINUSOID", point_id=12345, point_type=PointType.FLOAT64)
+
+        assert hash(config) == hash(12345)
+        assert {config: "found"}[same] == "found"
+
 
 class TestSummaryType:
     """Tests for SummaryType enum."""
@@ -150,101 +235,68 @@ class TestSummaryType:
 class TestPointConfigExtended:
     """Tests for PointConfig extended attributes."""
 
-    def test_alarm_thresholds(self) -> None:
-        """Test PointConfig with alarm thresholds."""
-        config = PointConfig(
-            name="TEMP1",
-            point_id=100,
-            point_type=PointType.FLOAT64,
-            value_high_alarm=100.0,
-            value_low_alarm=0.0,
-            value_high_warning=90.0,
-            value_low_warning=10.0,
-        )
-
-        assert config.value_high_alarm == 100.0
-        assert config.value_low_alarm == 0.0
-        assert config.value_high_warning == 90.0
-        assert config.value_low_warning == 10.0
-
-    def test_rate_of_change_limits(self) -> None:
-        """Test PointConfig with rate of change limits."""
-        config = PointConfig(
-            name="FLOW1",
-            point_id=101,
-            point_type=PointType.FLOAT32,
-            roc_high_value=10.0,
-            roc_low_value=-10.0,
-        )
-
-        assert config.roc_high_value == 10.0
-        assert config.roc_low_value == -10.0
-
-    def test_interface_information(self) -> None:
-        """Test PointConfig with interface information."""
-        config = PointConfig(
-            name="PRESS1",
-            point_id=102,
-            point_type=PointType.FLOAT64,
-            interface_id=5,
-            interface_name="PI-OPC",
-        )
-
-        assert config.interface_id == 5
-        assert config.interface_name == "PI-OPC"
-
-    def test_scan_and_source_info(self) -> None:
-        """Test PointConfig with scan and source information."""
-        config = PointConfig(
-            name="LEVEL1",
-            point_id=103,
-            point_type=PointType.FLOAT32,
-            scan_time="1s",
-            source_point_id=200,
-            source_point_name="SOURCE_TAG",
-        )
-
-        assert config.scan_time == "1s"
-        assert config.source_point_id == 200
-        assert config.source_point_name == "SOURCE_TAG"
-
-    def test_additional_metadata(self) -> None:
-        """Test PointConfig with additional metadata."""
-        config = PointConfig(
-            name="VALVE1",
-            point_id=104,
-            point_type=PointType.DIGITAL,
-            conversion_factor=1.5,
-            device_name="PLC001",
-            alias="VALVE_MAIN",
-        )
-
-        assert config.conversion_factor == 1.5
-        assert config.device_name == "PLC001"
-        assert config.alias == "VALVE_MAIN"
-
-    def test_all_new_attributes_default_none(self) -> None:
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            pytest.param(
+                {
+                    "value_high_alarm": 100.0,
+                    "value_low_alarm": 0.0,
+                    "value_high_warning": 90.0,
+                    "value_low_warning": 10.0,
+                },
+                id="alarm_thresholds",
+            ),
+            pytest.param(
+                {"roc_high_value": 10.0, "roc_low_value": -10.0},
+                id="rate_of_change_limits",
+            ),
+            pytest.param(
+                {"interface_id": 5, "interface_name": "PI-OPC"},
+                id="interface_information",
+            ),
+            pytest.param(
+                {"scan_time": "1s", "source_point_id": 200, "source_point_name": "SOURCE_TAG"},
+                id="scan_and_source_info",
+            ),
+            pytest.param(
+                {"conversion_factor": 1.5, "device_name": "PLC001", "alias": "VALVE_MAIN"},
+                id="additional_metadata",
+            ),
+        ],
+    )
+    def test_extended_attributes(
+        self,
+        base_config: PointConfig,
+        expected: dict[str, Any],
+    ) -> None:
+        """Test PointConfig with each group of extended attributes."""
+        config = replace(base_config, **expected)
+
+        for attribute, value in expected.items():
+            assert getattr(config, attribute) == value
+
+    def test_all_new_attributes_default_none(self, base_config: PointConfig) -> None:
         """Test that new attributes default to None or empty string."""
-        config = PointConfig(
-            name="TEST",
-            point_id=1,
-            point_type=PointType.FLOAT64,
-        )
-
-        assert config.value_high_alarm is None
-        assert config.value_low_alarm is None
-        assert config.value_high_warning is None
-        assert config.value_low_warning is None
-        assert config.roc_high_value is None
-        assert config.roc_low_value is None
-        assert config.interface_id is None
-        assert config.interface_name == ""
-        assert config.scan_time == ""
-        assert config.source_point_id is None
-        assert config.source_point_name == ""
-        assert config.conversion_factor is None
-        assert config.device_name == ""
-        assert config.alias == ""
+        expected_defaults = {
+            "value_high_alarm": None,
+            "value_low_alarm": None,
+            "value_high_warning": None,
+            "value_low_warning": None,
+            "roc_high_value": None,
+            "roc_low_value": None,
+            "interface_id": None,
+            "interface_name": "",
+            "scan_time": "",
+            "source_point_id": None,
+            "source_point_name": "",
+            "conversion_factor": None,
+            "device_name": "",
+            "alias": "",
+        }
+
+        actual = {name: getattr(base_config, name) for name in expected_defaults}
+        assert actual == expected_defaults
 
 
 class TestAnalysisStatus:
@@ -352,5 +404,5 @@ class TestAnalysisInfo:
             path="/path",
         )
 
-        with pytest.raises(AttributeError):
+        with pytest.raises(FrozenInstanceError):
             info.name = "New Name"  # type: ignore